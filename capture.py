@@ -2,16 +2,108 @@ import tkinter as tk
 from tkinter import messagebox
 import numpy as np
 from PIL import Image, ImageTk, ImageGrab
-import keyboard
 import threading
+import queue
 import time
 import os
+import sys
+import ctypes
+import hashlib
+import functools
 from datetime import datetime
-from modules.core import OCREngine
+from typing import Optional
+from modules.core import get_default_ocr_engine
 from modules.utils import UILogger, OCRProcessor
 
+try:
+    import keyboard  # type: ignore
+except ImportError:
+    keyboard = None
+
+# 系统热键（RegisterHotKey）：由系统消息队列分发WM_HOTKEY，按键时无Python回调开销。
+# 注意无修饰键的系统热键会独占该按键（其他程序中无法输入'g'），因此默认仍使用keyboard库，
+# 设置环境变量 HOOKEXE_NATIVE_HOTKEYS=1 或未安装keyboard时启用。
+USE_NATIVE_HOTKEYS = os.environ.get("HOOKEXE_NATIVE_HOTKEYS") == "1"
+MOD_SHIFT = 0x0004
+MOD_NOREPEAT = 0x4000
+WM_HOTKEY = 0x0312
+WM_QUIT = 0x0012
+PM_NOREMOVE = 0x0000
+CTRL_C_EVENT = 0
+CTRL_BREAK_EVENT = 1
+
+# 可选的高速截图后端：DXCam（DXGI桌面复制）> mss > PIL ImageGrab
+try:
+    import dxcam  # type: ignore
+except ImportError:
+    dxcam = None
+
+try:
+    import mss  # type: ignore
+except ImportError:
+    mss = None
+
+# 可选的快速哈希：xxh3 (SIMD加速)，不可用时回退到blake2b
+try:
+    import xxhash  # type: ignore
+except ImportError:
+    xxhash = None
+
+OCR_QUEUE_SIZE = 2   # 待识别截图队列上限，连续按键时丢弃最旧的任务
+HOTKEY_DEBOUNCE = 0.25    # 热键防抖间隔（秒），长按时忽略重复触发
+
+
+def _content_signature(img_array: np.ndarray) -> tuple:
+    """对全部像素求哈希作为画面签名，任意像素变化都会改变签名（不会漏掉少量文字的变化）
+    
+    Args:
+        img_array: C连续的像素数组（直接按缓冲区读取，不再复制）
+        
+    Returns:
+        (形状, 指纹) 的元组
+    """
+    if xxhash is not None:
+        digest = xxhash.xxh3_128_digest(img_array)
+    else:
+        digest = hashlib.blake2b(img_array, digest_size=16).digest()
+    return (img_array.shape, digest)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_ocr_processor() -> Optional[OCRProcessor]:
+    """创建进程内共享的OCR处理器（OCR模型只初始化一次）"""
+    logger = UILogger(print)
+    logger.log_message("正在初始化OCR处理器...")
+    try:
+        # 获取共享的OCR引擎（单例，模型只加载一次并在后台预热）
+        ocr_engine = get_default_ocr_engine(
+            lang="ch",
+            use_gpu=False,
+            confidence_threshold=0.7  # 与main.py保持一致
+        )
+        
+        # 创建OCR处理器
+        ocr_processor = OCRProcessor(
+            ocr_engine=ocr_engine,
+            logger=logger,
+            save_path="./screenshots"
+        )
+        
+        logger.log_message("OCR处理器初始化完成（标准模式，平均识别时间~0.2秒）")
+        return ocr_processor
+    except Exception as e:
+        logger.log_message(f"OCR处理器初始化失败: {e}", "ERROR")
+        return None
+
 class ScreenCapture:
-    def __init__(self):
+    def __init__(self, logger: Optional[UILogger] = None, processor: Optional[OCRProcessor] = None):
+        """
+        初始化截图工具
+        
+        Args:
+            logger: 日志记录器，默认输出到控制台
+            processor: OCR处理器，默认使用进程内共享的处理器
+        """
         self.root = None
         self.canvas = None
         self.start_x = None
@@ -21,40 +113,172 @@ class ScreenCapture:
         self.selected_area = None
         
         # 初始化日志系统
-        self.logger = UILogger(print)  # 使用print作为日志输出
+        self.logger = logger or UILogger(print)  # 默认使用print作为日志输出
         
-        # 初始化OCR处理器（使用新的封装模块）
-        self.logger.log_message("正在初始化OCR处理器...")
+        # 截图后端（DXCam实例只创建一次，后续截图复用）
+        self._camera = None
+        self._mss_local = threading.local()  # mss实例不能跨线程使用
+        self._last_backend = None
+        self._screen_size = None
+        self._default_region = None
+        self._pre_frame = None  # 遮罩出现前截取的整屏画面
+        # 最近一次识别成功的默认截图 (签名, 识别结果)，只由默认截图写入，识别完成后才记录
+        self._last_default = None
+        self._init_capture_backend()
+        
+        # OCR处理器在进程内共享，重复创建ScreenCapture不会再次加载模型
+        self.ocr_processor = processor or _get_ocr_processor()
+        
+        # OCR在独立的工作线程中执行，避免阻塞热键监听和Tk回调
+        self._ocr_q = queue.Queue(maxsize=OCR_QUEUE_SIZE)
+        self._ocr_thread = threading.Thread(target=self._ocr_worker, daemon=True)
+        self._ocr_thread.start()
+    
+    def _init_capture_backend(self):
+        """初始化DXCam截图后端，失败时回退到mss/ImageGrab"""
+        if dxcam is None:
+            return
         try:
-            # 创建OCR引擎
-            ocr_engine = OCREngine(
-                lang="ch",
-                use_gpu=False,
-                confidence_threshold=0.7  # 与main.py保持一致
-            )
+            self._camera = dxcam.create(output_color="RGB")
+        except Exception as e:
+            self.logger.log_message(f"DXCam初始化失败，回退到mss/ImageGrab: {e}", "WARNING")
+            self._camera = None
+    
+    def _set_backend(self, backend: str):
+        """记录当前使用的截图后端，切换时输出日志便于发现性能回退"""
+        if backend != self._last_backend:
+            self._last_backend = backend
+            self.logger.log_message(f"截图后端: {backend}")
+    
+    def grab_region(self, bbox: tuple) -> np.ndarray:
+        """截取屏幕区域
+        
+        Args:
+            bbox: 截图区域 (left, top, right, bottom)
             
-            # 创建OCR处理器
-            self.ocr_processor = OCRProcessor(
-                ocr_engine=ocr_engine,
-                logger=self.logger,
-                save_path="./screenshots"
-            )
+        Returns:
+            RGB像素数组 (H, W, 3)
+        """
+        if self._camera is not None:
+            try:
+                # 画面与上一帧相同时DXCam返回None，此时回退到其他后端
+                frame = self._camera.grab(region=bbox)
+            except Exception as e:
+                self.logger.log_message(f"DXCam截图失败: {e}", "WARNING")
+                frame = None
+            if frame is not None:
+                self._set_backend("dxcam")
+                return frame
+        
+        if mss is not None:
+            try:
+                sct = getattr(self._mss_local, 'sct', None)
+                if sct is None:
+                    sct = self._mss_local.sct = mss.mss()
+                left, top, right, bottom = bbox
+                shot = sct.grab({'left': left, 'top': top, 'width': right - left, 'height': bottom - top})
+                self._set_backend("mss")
+                return np.asarray(shot)[:, :, 2::-1]  # BGRA -> RGB 视图，不复制
+            except Exception as e:
+                self.logger.log_message(f"mss截图失败: {e}", "WARNING")
+        
+        screenshot = ImageGrab.grab(bbox=bbox)
+        self._set_backend("ImageGrab")
+        img_array = np.asarray(screenshot)  # 只读视图，避免再复制一次像素
+        if img_array.shape[-1] == 4:
+            # 部分配置（如HDR显示器）返回RGBA，切片去掉Alpha通道（零拷贝视图）
+            img_array = img_array[..., :3]
+        return img_array
+    
+    def _get_screen_size(self) -> tuple:
+        """获取屏幕尺寸（只查询一次）"""
+        if self._screen_size is None:
+            if self._camera is not None:
+                self._screen_size = (self._camera.width, self._camera.height)
+            else:
+                self._screen_size = ImageGrab.grab().size
+        return self._screen_size
+    
+    def _get_default_region(self) -> tuple:
+        """计算屏幕居中的默认截图区域（只计算一次）"""
+        if self._default_region is None:
+            screen_width, screen_height = self._get_screen_size()
             
-            self.logger.log_message("OCR处理器初始化完成（标准模式，平均识别时间~0.2秒）")
-        except Exception as e:
-            self.logger.log_message(f"OCR处理器初始化失败: {e}", "ERROR")
-            self.ocr_processor = None
+            # 计算居中的600x600区域
+            width, height = self.capture_size
+            left = (screen_width - width) // 2
+            top = (screen_height - height) // 2
+            self._default_region = (left, top, left + width, top + height)
+        return self._default_region
+    
+    def _ocr_worker(self):
+        """OCR工作线程：依次处理队列中的截图"""
+        while True:
+            img_array, filename_prefix, sig = self._ocr_q.get()
+            try:
+                self.recognize(img_array, filename_prefix, sig)
+            except Exception as e:
+                self.logger.log_message(f"OCR识别出错: {e}", "ERROR")
+    
+    def submit_ocr(self, img_array: np.ndarray, filename_prefix: str, sig: Optional[tuple] = None):
+        """将截图提交到OCR工作线程，队列已满时丢弃最旧的任务
+        
+        Args:
+            img_array: 截图像素数组
+            filename_prefix: 文件名前缀
+            sig: 默认截图的画面签名（识别完成后记录，见recognize）
+        """
+        task = (img_array, filename_prefix, sig)
+        try:
+            self._ocr_q.put_nowait(task)
+        except queue.Full:
+            try:
+                self._ocr_q.get_nowait()
+            except queue.Empty:
+                pass
+            self.logger.log_message("OCR任务积压，已丢弃最旧的截图", "WARNING")
+            self._ocr_q.put_nowait(task)
+    
+    def recognize(self, img_array: np.ndarray, filename_prefix: str, sig: Optional[tuple] = None) -> list:
+        """OCR识别并保存截图（画面内容与处理器缓存完全一致时由处理器复用识别结果）
+        
+        Args:
+            img_array: 截图像素数组
+            filename_prefix: 文件名前缀
+            sig: 默认截图的画面签名，提供时在识别完成后与结果一起记录，供下一次默认截图比较
+            
+        Returns:
+            OCR识别结果列表
+        """
+        if not self.ocr_processor:
+            self.logger.log_message("OCR处理器未初始化，无法进行识别", "ERROR")
+            return []
+        
+        screenshot = Image.fromarray(img_array)
+        results = self.ocr_processor.recognize_and_save(screenshot, filename_prefix=filename_prefix)
+        if sig is not None:
+            self._last_default = (sig, results)
+        return results
     
     def create_capture_window(self):
         """创建截图窗口"""
+        # 在遮罩窗口出现之前截取整屏画面，选区确定后直接切片，无需隐藏窗口再截图
+        try:
+            screen_width, screen_height = self._get_screen_size()
+            self._pre_frame = self.grab_region((0, 0, screen_width, screen_height))
+        except Exception as e:
+            self.logger.log_message(f"预截整屏画面失败，将在选区后重新截图: {e}", "WARNING")
+            self._pre_frame = None
+        
         self.root = tk.Toplevel()
         self.root.attributes('-fullscreen', True)
         self.root.attributes('-alpha', 0.3)
         self.root.attributes('-topmost', True)
         self.root.configure(bg='black', cursor='cross')  # 修复 cursor 设置
         
-        # 创建画布
+        # 创建画布（新画布上没有旧的选框）
         self.canvas = tk.Canvas(self.root, highlightthickness=0)
+        self.rect = None
         self.canvas.pack(fill='both', expand=True)
         
         # 绑定鼠标事件
@@ -79,19 +303,19 @@ class ScreenCapture:
         """鼠标按下事件"""
         self.start_x = event.x
         self.start_y = event.y
-        if self.rect and self.canvas:  # 添加空值检查
-            self.canvas.delete(self.rect)
+        if self.canvas:  # 添加空值检查
+            if self.rect:
+                self.canvas.delete(self.rect)
+            # 选框只创建一次，拖拽过程中通过coords更新
+            self.rect = self.canvas.create_rectangle(
+                self.start_x, self.start_y, self.start_x, self.start_y,
+                outline='red', width=2
+            )
     
     def on_drag(self, event):
         """鼠标拖拽事件"""
         if self.rect and self.canvas:  # 添加空值检查
-            self.canvas.delete(self.rect)
-        
-        if self.canvas and self.start_x is not None and self.start_y is not None:  # 添加空值检查
-            self.rect = self.canvas.create_rectangle(
-                self.start_x, self.start_y, event.x, event.y,
-                outline='red', width=2
-            )
+            self.canvas.coords(self.rect, self.start_x, self.start_y, event.x, event.y)
     
     def on_release(self, event):
         """鼠标释放事件"""
@@ -113,6 +337,7 @@ class ScreenCapture:
         if self.root:
             self.root.destroy()
             self.root = None
+        self._pre_frame = None
     
     def perform_capture(self):
         """执行截图"""
@@ -120,91 +345,212 @@ class ScreenCapture:
             return
         
         try:
-            # 隐藏截图窗口
-            if self.root:  # 添加空值检查
-                self.root.withdraw()
-            time.sleep(0.1)  # 等待窗口完全隐藏
-            
-            # 进行截图
             x1, y1, x2, y2 = self.selected_area
-            screenshot = ImageGrab.grab(bbox=(x1, y1, x2, y2))
+            if self._pre_frame is not None:
+                # 从预截的整屏画面中切片（numpy视图，无额外截图）
+                img_array = self._pre_frame[y1:y2, x1:x2]
+            else:
+                # 隐藏截图窗口并立即刷新事件队列，不再固定等待
+                if self.root:  # 添加空值检查
+                    self.root.withdraw()
+                    self.root.update_idletasks()
+                    self.root.update()
+                
+                # 进行截图（直接得到numpy数组）
+                img_array = self.grab_region(self.selected_area)
             
             # 关闭截图窗口
             self.cancel_capture()
             
-            # 转换为numpy数组进行OCR识别
-            img_array = np.array(screenshot)
-            
             self.logger.log_message(f"截图完成，尺寸: {img_array.shape}")
             self.logger.log_message("正在进行OCR识别...")
             
-            # 调用OCR处理器进行识别和保存
-            if self.ocr_processor:
-                self.ocr_processor.recognize_and_save(screenshot, filename_prefix="capture_manual")
-            else:
-                self.logger.log_message("OCR处理器未初始化，无法进行识别", "ERROR")
+            # 提交到OCR工作线程进行识别和保存
+            self.submit_ocr(img_array, "capture_manual")
             
         except Exception as e:
             print(f"截图失败: {e}")
             self.cancel_capture()
 
-    def default_capture(self):
-        """默认大小截图 (600x600)"""
+    def default_capture(self, wait: bool = True):
+        """默认大小截图 (600x600)
+        
+        Args:
+            wait: 是否在当前线程等待OCR识别完成；为False时提交到后台工作线程（热键回调使用）
+            
+        Returns:
+            OCR识别结果列表（画面与上次截图相同时返回上次的结果）；wait为False时返回None
+        """
         try:
-            # 获取屏幕中心位置
-            screen = ImageGrab.grab()
-            screen_width, screen_height = screen.size
+            # 截图（居中区域已缓存）
+            img_array = self.grab_region(self._get_default_region())
             
-            # 计算居中的600x600区域
-            width, height = self.capture_size
-            left = (screen_width - width) // 2
-            top = (screen_height - height) // 2
-            right = left + width
-            bottom = top + height
+            # mss返回的是BGRA->RGB切片视图：在此显式整理为连续数组（OCR转换为PIL图像时本来也要复制一次），
+            # 签名与后续识别共用这一份像素
+            img_array = np.ascontiguousarray(img_array)
             
-            # 截图
-            screenshot = ImageGrab.grab(bbox=(left, top, right, bottom))
-            img_array = np.array(screenshot)
+            # 画面与上一次默认截图完全相同时直接跳过OCR
+            sig = _content_signature(img_array)
+            last_default = self._last_default
+            if last_default is not None and last_default[0] == sig:
+                self.logger.log_message("画面与上次截图相同，跳过OCR识别")
+                return last_default[1] if wait else None
             
             self.logger.log_message(f"默认截图完成，尺寸: {img_array.shape}")
             self.logger.log_message("正在进行OCR识别...")
             
-            # 调用OCR处理器进行识别和保存
-            if self.ocr_processor:
-                return self.ocr_processor.recognize_and_save(screenshot, filename_prefix="capture_manual_default")
-            else:
-                self.logger.log_message("OCR处理器未初始化，无法进行识别", "ERROR")
-                return []
+            if wait:
+                return self.recognize(img_array, "capture_manual_default", sig)
+            
+            # 提交到OCR工作线程进行识别和保存
+            self.submit_ocr(img_array, "capture_manual_default", sig)
+            return None
             
         except Exception as e:
             self.logger.log_message(f"默认截图失败: {e}", "ERROR")
-            return []
+            return [] if wait else None
     
-    def start_capture(self, use_selection=True):
-        """开始截图"""
+    def start_capture(self, use_selection=True, wait: bool = True):
+        """开始截图
+        
+        Args:
+            use_selection: 是否框选区域截图，为False时截取默认大小区域
+            wait: 默认大小截图时是否等待OCR识别完成并返回结果
+        """
         if use_selection:
             # 创建选择区域截图窗口
             self.create_capture_window()
         else:
             # 使用默认大小截图
-            return self.default_capture()
+            return self.default_capture(wait=wait)
+
+def make_default_capture(logger=print, processor: Optional[OCRProcessor] = None) -> ScreenCapture:
+    """
+    创建截图工具实例的便捷函数
+    
+    Args:
+        logger: 日志输出函数（如print或UI的日志回调）
+        processor: OCR处理器，为None时使用进程内共享的处理器
+        
+    Returns:
+        ScreenCapture实例
+    """
+    return ScreenCapture(logger=UILogger(logger), processor=processor)
 
-def on_key_press():
-    """键盘监听函数"""
-    capture = ScreenCapture()
+def _debounce(func, interval: float = HOTKEY_DEBOUNCE):
+    """包装热键回调：距上次触发不足interval秒时直接忽略"""
+    last = [0.0]
+    
+    @functools.wraps(func)
+    def wrapper():
+        now = time.monotonic()
+        if now - last[0] < interval:
+            return None
+        last[0] = now
+        return func()
+    return wrapper
+
+def run_native_hotkeys(hotkeys: list, stop_event: Optional[threading.Event] = None):
+    """注册系统热键并在当前线程运行消息循环（阻塞，直到stop_event被设置或收到Ctrl+C）
+    
+    GetMessageW阻塞等待消息，空闲时线程不会被唤醒；stop_event被设置（控制台Ctrl+C时由控制台
+    处理函数设置）后，等待线程向本线程投递WM_QUIT结束循环，退出时在finally中注销热键。
+    
+    Args:
+        hotkeys: [(修饰键, 虚拟键码, 回调函数), ...]
+        stop_event: 退出事件，设置后消息循环结束；循环结束时也会被设置
+        
+    Raises:
+        OSError: 热键注册失败（例如已被其他程序占用）
+    """
+    from ctypes import wintypes
+    user32 = ctypes.windll.user32  # type: ignore
+    kernel32 = ctypes.windll.kernel32  # type: ignore
+    user32.RegisterHotKey.argtypes = [wintypes.HWND, ctypes.c_int, wintypes.UINT, wintypes.UINT]
+    user32.RegisterHotKey.restype = wintypes.BOOL
+    user32.UnregisterHotKey.argtypes = [wintypes.HWND, ctypes.c_int]
+    user32.UnregisterHotKey.restype = wintypes.BOOL
+    user32.PeekMessageW.argtypes = [ctypes.POINTER(wintypes.MSG), wintypes.HWND,
+                                    wintypes.UINT, wintypes.UINT, wintypes.UINT]
+    user32.PeekMessageW.restype = wintypes.BOOL
+    user32.GetMessageW.argtypes = [ctypes.POINTER(wintypes.MSG), wintypes.HWND, wintypes.UINT, wintypes.UINT]
+    user32.GetMessageW.restype = ctypes.c_int  # 出错时返回-1
+    user32.PostThreadMessageW.argtypes = [wintypes.DWORD, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM]
+    user32.PostThreadMessageW.restype = wintypes.BOOL
+    kernel32.GetCurrentThreadId.restype = wintypes.DWORD
+    handler_type = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.DWORD)  # type: ignore
+    kernel32.SetConsoleCtrlHandler.argtypes = [handler_type, wintypes.BOOL]
+    kernel32.SetConsoleCtrlHandler.restype = wintypes.BOOL
+    stop_event = stop_event or threading.Event()
+    
+    @handler_type
+    def console_handler(ctrl_type):
+        # 阻塞在GetMessageW中时KeyboardInterrupt无法送达，由控制台处理函数通知退出；
+        # 返回False交给后续处理函数，主线程照常收到KeyboardInterrupt
+        if ctrl_type in (CTRL_C_EVENT, CTRL_BREAK_EVENT):
+            stop_event.set()
+        return False
     
+    callbacks = {}
+    handler_installed = False
+    try:
+        for hotkey_id, (modifiers, vk, callback) in enumerate(hotkeys, 1):
+            # 热键绑定到当前线程的消息队列，必须在同一线程中取消息
+            if not user32.RegisterHotKey(None, hotkey_id, modifiers | MOD_NOREPEAT, vk):
+                raise OSError(f"注册热键失败: id={hotkey_id}, vk={vk:#x}")
+            callbacks[hotkey_id] = callback
+        
+        msg = wintypes.MSG()
+        # 确保本线程的消息队列已创建，之后投递的WM_QUIT不会丢失
+        user32.PeekMessageW(ctypes.byref(msg), None, 0, 0, PM_NOREMOVE)
+        thread_id = kernel32.GetCurrentThreadId()
+        handler_installed = bool(kernel32.SetConsoleCtrlHandler(console_handler, True))
+        
+        def post_quit_on_stop():
+            stop_event.wait()
+            user32.PostThreadMessageW(thread_id, WM_QUIT, 0, 0)
+        threading.Thread(target=post_quit_on_stop, name="HotkeyStop", daemon=True).start()
+        
+        while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+            if msg.message == WM_HOTKEY:
+                callback = callbacks.get(msg.wParam)
+                if callback:
+                    callback()
+    finally:
+        stop_event.set()  # 循环因错误退出时同时结束等待线程
+        if handler_installed:
+            kernel32.SetConsoleCtrlHandler(console_handler, False)
+        for hotkey_id in callbacks:
+            user32.UnregisterHotKey(None, hotkey_id)
+
+def on_key_press(stop_event: Optional[threading.Event] = None):
+    """键盘监听函数
+    
+    Args:
+        stop_event: 退出事件（系统热键模式下设置后消息循环结束并注销热键）
+    """
+    capture = make_default_capture()
+    
+    @_debounce
     def handle_g_key():
         capture.logger.log_message("检测到按键 'g'，开始区域截图...")
         capture.start_capture(use_selection=True)
     
+    @_debounce
     def handle_shift_g_key():
         capture.logger.log_message("检测到按键 'Shift+g'，开始默认大小截图...")
-        result = capture.start_capture(use_selection=False)  # 存储结果但不返回
+        # 热键回调不等待识别，OCR在后台工作线程中完成，监听线程保持响应
+        capture.start_capture(use_selection=False, wait=False)
         return None  # 显式返回 None
     
-    # 注册热键
-    keyboard.add_hotkey('g', handle_g_key)
-    keyboard.add_hotkey('shift+g', handle_shift_g_key)
+    use_native = sys.platform == "win32" and (USE_NATIVE_HOTKEYS or keyboard is None)
+    if not use_native:
+        if keyboard is None:
+            capture.logger.log_message("未安装keyboard库，无法注册热键", "ERROR")
+            return
+        # 注册热键
+        keyboard.add_hotkey('g', handle_g_key)
+        keyboard.add_hotkey('shift+g', handle_shift_g_key)
     
     capture.logger.log_message("截图程序已启动！")
     capture.logger.log_message("按 'g' 键进行区域截图")
@@ -212,7 +558,21 @@ def on_key_press():
     capture.logger.log_message("按 'Ctrl+C' 退出程序")
     
     try:
-        keyboard.wait('ctrl+c')
+        if use_native:
+            try:
+                run_native_hotkeys([
+                    (0, ord('G'), handle_g_key),
+                    (MOD_SHIFT, ord('G'), handle_shift_g_key),
+                ], stop_event)
+            except OSError as e:
+                if keyboard is None:
+                    raise
+                capture.logger.log_message(f"{e}，回退到keyboard库", "WARNING")
+                keyboard.add_hotkey('g', handle_g_key)
+                keyboard.add_hotkey('shift+g', handle_shift_g_key)
+                keyboard.wait('ctrl+c')
+        else:
+            keyboard.wait('ctrl+c')
     except KeyboardInterrupt:
         pass
     finally:
@@ -224,11 +584,16 @@ if __name__ == "__main__":
     root.withdraw()  # 隐藏主窗口
     
     # 启动键盘监听
-    keyboard_thread = threading.Thread(target=on_key_press, daemon=True)
+    stop_event = threading.Event()
+    keyboard_thread = threading.Thread(target=on_key_press, args=(stop_event,), daemon=True)
     keyboard_thread.start()
     
     # 启动GUI主循环
     try:
         root.mainloop()
     except KeyboardInterrupt:
-        print("程序被用户中断")
\ No newline at end of file
+        print("程序被用户中断")
+    finally:
+        # 通知系统热键消息循环退出，使其注销热键
+        stop_event.set()
+        keyboard_thread.join(timeout=1.0)
\ No newline at end of file
@@ -8,6 +8,7 @@
 import sys
 import importlib
 import platform
+from concurrent.futures import ThreadPoolExecutor
 
 def check_python_version():
     """检查Python版本"""
@@ -21,34 +22,49 @@ def check_python_version():
         print("✓ Python版本符合要求")
         return True
 
+# 导入探测结果缓存 {包名: 异常对象或None}
+_probe_results = {}
+
+def _probe_import(package):
+    """尝试导入一个库，返回导入时的异常（成功返回None），结果会被缓存"""
+    if package not in _probe_results:
+        try:
+            importlib.import_module(package)
+            _probe_results[package] = None
+        except Exception as e:
+            _probe_results[package] = e
+    return _probe_results[package]
+
+def probe_libraries(packages, max_workers=8):
+    """并发导入多个库（paddleocr、cv2等大型库的导入相互重叠）
+    
+    结果写入缓存，随后按原顺序输出检查结果时不会重复导入。
+    """
+    pending = [p for p in dict.fromkeys(packages) if p not in _probe_results]
+    if not pending:
+        return
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(_probe_import, pending))
+
 def check_library(name, package=None, description=""):
     """检查单个库是否可用"""
-    try:
-        if package:
-            importlib.import_module(package)
-        else:
-            importlib.import_module(name)
-        
+    error = _probe_import(package or name)
+    if error is None:
         print(f"✓ {name:<15} - {description}")
         return True
-    except ImportError as e:
-        print(f"❌ {name:<15} - {description} (导入失败: {e})")
+    elif isinstance(error, ImportError):
+        print(f"❌ {name:<15} - {description} (导入失败: {error})")
         return False
-    except Exception as e:
-        print(f"⚠️ {name:<15} - {description} (其他错误: {e})")
+    else:
+        print(f"⚠️ {name:<15} - {description} (其他错误: {error})")
         return False
 
 def check_optional_library(name, package=None, description="", reason=""):
     """检查可选库"""
-    try:
-        if package:
-            importlib.import_module(package)
-        else:
-            importlib.import_module(name)
-        
+    if _probe_import(package or name) is None:
         print(f"✓ {name:<15} - {description}")
         return True
-    except ImportError:
+    else:
         print(f"! {name:<15} - {description} ({reason})")
         return False
 
@@ -93,6 +109,14 @@ def check_specific_functions():
     except Exception as e:
         print(f"❌ OpenCV - 功能测试失败: {e}")
 
+# Windows特定库
+WINDOWS_LIBS = [
+    ("pywin32", "win32gui", "Windows API调用"),
+    ("win32process", "win32process", "进程管理API"),
+    ("win32con", "win32con", "Windows常量"),
+    ("win32api", "win32api", "Windows基础API"),
+]
+
 def check_system_specific():
     """检查系统特定的库"""
     system = platform.system()
@@ -100,10 +124,8 @@ def check_system_specific():
     
     if system == "Windows":
         # Windows特定库
-        check_library("pywin32", "win32gui", "Windows API调用")
-        check_library("win32process", "win32process", "进程管理API")
-        check_library("win32con", "win32con", "Windows常量")
-        check_library("win32api", "win32api", "Windows基础API")
+        for name, package, desc in WINDOWS_LIBS:
+            check_library(name, package, desc)
     else:
         print("! pywin32相关库 - 非Windows系统，跳过检查")
 
@@ -129,6 +151,24 @@ def main():
         ("keyboard", "keyboard", "键盘监听库"),
     ]
     
+    # 可选库检查
+    optional_libs = [
+        ("shapely", "shapely", "几何形状处理", "PaddleOCR可能需要"),
+        ("pyclipper", "pyclipper", "多边形裁剪", "OCR区域处理"),
+        ("requests", "requests", "HTTP请求库", "模型下载"),
+        ("dxcam", "dxcam", "DXGI桌面复制截图", "capture.py高速截图与桌面复制截图方法"),
+        ("mss", "mss", "快速屏幕截图", "DXCam不可用时的回退"),
+        ("numba", "numba", "JIT编译加速", "像素处理内核"),
+        ("xxhash", "xxhash", "快速哈希", "OCR结果缓存"),
+        ("threading", "threading", "多线程支持", "Python内置"),
+    ]
+    
+    # 并发导入所有待检查的库，之后按原顺序输出结果
+    packages = [package or name for name, package, *_ in required_libs + optional_libs]
+    if platform.system() == "Windows":
+        packages += [package for _, package, _ in WINDOWS_LIBS]
+    probe_libraries(packages)
+    
     success_count = 0
     total_count = len(required_libs)
     
@@ -141,14 +181,6 @@ def main():
     
     print("\n=== 可选依赖库检查 ===")
     
-    # 可选库检查
-    optional_libs = [
-        ("shapely", "shapely", "几何形状处理", "PaddleOCR可能需要"),
-        ("pyclipper", "pyclipper", "多边形裁剪", "OCR区域处理"),
-        ("requests", "requests", "HTTP请求库", "模型下载"),
-        ("threading", "threading", "多线程支持", "Python内置"),
-    ]
-    
     for name, package, desc, reason in optional_libs:
         check_optional_library(name, package, desc, reason)
     
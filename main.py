@@ -5,15 +5,32 @@
 
 import os
 import time
+import queue
 import threading
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from tkinter import messagebox, filedialog
-from typing import List, Dict, Optional
+from tkinter import messagebox, filedialog, TclError
+from typing import Dict, Optional
 
 # 导入各个功能模块
 from modules.ui import ProcessCaptureUI
-from modules.core import ProcessManager, ScreenshotEngine, OCREngine
+from modules.core import (ProcessManager, ProcessResults, ScreenshotEngine, get_default_ocr_engine,
+                          OCRSubprocessClient)
 from modules.utils import UILogger, TimingRecorder, OCRProcessor
+from modules.core.pixel_ops import average_hash, hamming_distance
+
+FRAME_HASH_SIZE = 16      # 自动截图重复帧检测的哈希边长（16x16=256位）
+FRAME_HASH_DISTANCE = 3   # 汉明距离小于该值视为画面未变化
+MIN_CAPTURE_INTERVAL = 0.05  # 自动截图最小间隔（秒），避免间隔为0时after(0)空转
+# 不需要激活窗口的截图方法（截图方法内部自行处理回退）
+NO_ACTIVATION_METHODS = ("background", "smart", "desktop_duplication")
+# 设置环境变量 HOOKEXE_OCR_SUBPROCESS=1 时OCR在独立子进程中运行，不与界面线程争抢GIL
+USE_OCR_SUBPROCESS = os.environ.get("HOOKEXE_OCR_SUBPROCESS") == "1"
+# 设置环境变量 HOOKEXE_OCR_DISK_CACHE=1 时识别结果缓存保存到截图目录，下次启动相同画面无需重新识别
+USE_OCR_DISK_CACHE = os.environ.get("HOOKEXE_OCR_DISK_CACHE") == "1"
+# 截图保存格式（png/webp/jpeg/bmp/npy），调试时可设为bmp或npy跳过压缩编码
+SAVE_FORMAT = os.environ.get("HOOKEXE_SAVE_FORMAT", "png")
 
 
 class ProcessCaptureApp:
@@ -25,7 +42,9 @@ class ProcessCaptureApp:
         self.ui = ProcessCaptureUI()
         
         # 初始化核心组件
-        self.logger = UILogger(self.ui.log_message)
+        # 逐条识别文本以DEBUG级别输出，界面勾选"显示识别文本"（默认）时一并显示
+        self.logger = UILogger(self.ui.log_message,
+                               min_level="DEBUG" if self.ui.is_ocr_detail_enabled() else "INFO")
         self.process_manager = ProcessManager(self.logger)
         self.screenshot_engine = ScreenshotEngine(self.logger)
         self.timing_recorder = TimingRecorder()
@@ -38,11 +57,32 @@ class ProcessCaptureApp:
         self.setup_ui_callbacks()
         
         # 自动截图控制
-        self.is_auto_capturing = False
-        self.auto_capture_thread = None
+        self._stop_event = threading.Event()  # 置位表示自动截图已停止
+        self._stop_event.set()
+        
+        # 自动截图的待识别帧（容量1）：OCR跟不上截图间隔时丢弃旧帧，只识别最新画面
+        self._auto_frames = queue.Queue(maxsize=1)
+        self._last_frame_key = None  # 最近一次OCR识别帧的 (窗口句柄, 尺寸, 识别区域, 指纹)
+        self._last_ocr_results = None  # 最近一次OCR识别结果
+        self._auto_ocr_thread = threading.Thread(target=self.auto_ocr_loop, daemon=True)
+        self._auto_ocr_thread.start()
+        
+        # 自动截图由Tk定时器按单调时钟调度，截图本身在单线程执行器中进行，不阻塞界面
+        self._auto_job = None  # 已安排的root.after任务
+        self._auto_deadline = 0.0  # 下一次截图的单调时钟时间
+        self._auto_future = None  # 正在进行的截图任务
+        self._auto_interval = MIN_CAPTURE_INTERVAL  # 上一次有效的截图间隔（秒）
+        self._interval_warned = False  # 本次自动截图是否已提示过间隔无效
+        self._capture_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="AutoCapture")
         
         # 进程列表缓存
-        self.cached_processes = []
+        self.cached_processes = ProcessResults()
+        
+        # 备用保存的单线程I/O执行器：写文件不阻塞截图线程
+        self._save_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ScreenshotSave")
+        
+        # 各进程的固定识别区域（按进程名保存）
+        self.process_regions: Dict[str, tuple] = {}
         
         self.logger.log_message("应用程序初始化完成")
     
@@ -51,18 +91,30 @@ class ProcessCaptureApp:
         try:
             self.logger.log_message("正在初始化OCR处理器...")
             
-            # 创建OCR引擎
-            ocr_engine = OCREngine(
-                lang="ch",
-                use_gpu=False,  # 避免GPU兼容性问题
-                confidence_threshold=0.7  # 优化置信度阈值，过滤低质量结果
-            )
+            ocr_engine = None
+            if USE_OCR_SUBPROCESS:
+                try:
+                    ocr_engine = OCRSubprocessClient(lang="ch", use_gpu=False, confidence_threshold=0.7,
+                                                     logger=self.logger)
+                    self.logger.log_message("OCR引擎在独立子进程中运行")
+                except Exception as e:
+                    self.logger.log_message(f"OCR子进程启动失败，改为进程内识别: {e}", "WARNING")
+            
+            # 获取共享的OCR引擎（单例，模型只加载一次并在后台预热）
+            if ocr_engine is None:
+                ocr_engine = get_default_ocr_engine(
+                    lang="ch",
+                    use_gpu=False,  # 避免GPU兼容性问题
+                    confidence_threshold=0.7  # 优化置信度阈值，过滤低质量结果
+                )
             
             # 创建OCR处理器
             self.ocr_processor = OCRProcessor(
                 ocr_engine=ocr_engine,
                 logger=self.logger,
-                save_path=self.ui.get_save_path()
+                save_path=self.ui.get_save_path(),
+                save_format=SAVE_FORMAT,
+                persist_cache=USE_OCR_DISK_CACHE
             )
             
             self.logger.log_message("OCR处理器初始化完成（标准模式，平均识别时间~0.2秒）")
@@ -78,10 +130,19 @@ class ProcessCaptureApp:
             capture_single_callback=self.capture_single_window,
             start_auto_callback=self.start_auto_capture,
             stop_auto_callback=self.stop_auto_capture,
-            browse_path_callback=self.browse_save_path
+            browse_path_callback=self.browse_save_path,
+            ocr_detail_callback=self.set_ocr_detail_logging
         )
     
-    def search_processes(self, keyword: str) -> List[Dict]:
+    def set_ocr_detail_logging(self, enabled: bool):
+        """切换日志中是否显示逐条识别文本
+        
+        Args:
+            enabled: 是否显示
+        """
+        self.logger.set_min_level("DEBUG" if enabled else "INFO")
+    
+    def search_processes(self, keyword: str) -> ProcessResults:
         """搜索包含关键字的进程
         
         Args:
@@ -90,12 +151,12 @@ class ProcessCaptureApp:
         Returns:
             匹配的进程列表
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         self.logger.log_message(f"开始搜索进程: '{keyword}'")
         
         try:
             found_processes = self.process_manager.find_processes_by_name(keyword)
-            search_time = time.time() - start_time
+            search_time = time.perf_counter() - start_time
             
             # 缓存搜索结果
             self.cached_processes = found_processes
@@ -108,9 +169,9 @@ class ProcessCaptureApp:
             return found_processes
             
         except Exception as e:
-            search_time = time.time() - start_time
+            search_time = time.perf_counter() - start_time
             self.logger.log_message(f"搜索进程出错: {e}，耗时: {search_time:.3f}秒", "ERROR")
-            return []
+            return ProcessResults()
     
     def capture_single_window(self) -> bool:
         """单次截图和OCR识别
@@ -129,11 +190,12 @@ class ProcessCaptureApp:
         process_info = self.cached_processes[selection_index]
         return self.capture_process_window(process_info)
     
-    def capture_process_window(self, process_info: Dict) -> bool:
+    def capture_process_window(self, process_info: Dict, defer_ocr: bool = False) -> bool:
         """截图指定进程的窗口
         
         Args:
             process_info: 进程信息字典
+            defer_ocr: 是否将OCR识别交给后台线程（自动截图使用），截图完成即返回
             
         Returns:
             是否成功
@@ -154,25 +216,37 @@ class ProcessCaptureApp:
             # 获取截图方法
             method = self.ui.get_capture_method()
             
-            # 阶段1: 窗口激活（仅在非后台模式下）
-            if method not in ["background", "smart"]:
+            # 阶段1: 不激活窗口的PrintWindow截图，成功时跳过窗口激活
+            # （后台/智能/桌面复制模式在截图方法内部自行处理）
+            screenshot = None
+            if method not in NO_ACTIVATION_METHODS:
                 if self.ui.is_timing_enabled():
-                    self.timing_recorder.start_timing("窗口激活")
+                    self.timing_recorder.start_timing("截图阶段")
                 
-                self.process_manager.activate_window(hwnd)
+                screenshot = self.screenshot_engine.capture_window_printwindow(hwnd)
+                if screenshot is not None:
+                    self.logger.log_message("PrintWindow截图成功，跳过窗口激活")
+            
+            # 阶段2: 窗口激活（仅在非后台模式且PrintWindow失败时）
+            if screenshot is None:
+                if method not in NO_ACTIVATION_METHODS:
+                    if self.ui.is_timing_enabled():
+                        self.timing_recorder.start_timing("窗口激活")
+                    
+                    self.process_manager.activate_window(hwnd)
+                    
+                    if self.ui.is_timing_enabled():
+                        self.timing_recorder.end_timing("窗口激活")
+                        activation_time = self.timing_recorder.get_timing("窗口激活")
+                        self.logger.log_message(f"窗口激活完成，耗时: {activation_time:.3f}秒")
+                else:
+                    self.logger.log_message(f"使用{method}模式，跳过窗口激活")
                 
+                # 阶段3: 截图
                 if self.ui.is_timing_enabled():
-                    self.timing_recorder.end_timing("窗口激活")
-                    activation_time = self.timing_recorder.get_timing("窗口激活")
-                    self.logger.log_message(f"窗口激活完成，耗时: {activation_time:.3f}秒")
-            else:
-                self.logger.log_message(f"使用{method}模式，跳过窗口激活")
-            
-            # 阶段2: 截图
-            if self.ui.is_timing_enabled():
-                self.timing_recorder.start_timing("截图阶段")
-            
-            screenshot = self.screenshot_engine.capture_window(hwnd, method, self.process_manager)
+                    self.timing_recorder.start_timing("截图阶段")
+                
+                screenshot = self.screenshot_engine.capture_window(hwnd, method, self.process_manager)
             
             if self.ui.is_timing_enabled():
                 self.timing_recorder.end_timing("截图阶段")
@@ -184,50 +258,11 @@ class ProcessCaptureApp:
                 self.ui.show_warning("警告", "截图失败，可能是应用程序有渲染保护或窗口被遮挡")
                 return False
             
-            # 阶段3: OCR识别和保存（使用新的OCRProcessor）
-            if self.ocr_processor:
-                if self.ui.is_timing_enabled():
-                    self.timing_recorder.start_timing("OCR识别")
-                
-                try:
-                    self.logger.log_message("开始OCR文字识别...")
-                    
-                    # 更新OCR处理器的保存路径
-                    self.ocr_processor.set_save_path(self.ui.get_save_path())
-                    
-                    # 使用OCR处理器进行识别和保存
-                    high_confidence_results = self.ocr_processor.recognize_and_save(
-                        screenshot, 
-                        process_info=process_info
-                    )
-                    
-                    if self.ui.is_timing_enabled():
-                        self.timing_recorder.end_timing("OCR识别")
-                        ocr_time = self.timing_recorder.get_timing("OCR识别")
-                        self.logger.log_message(f"OCR识别完成，耗时: {ocr_time:.3f}秒")
-                    
-                    # 更新UI状态
-                    if self.ui.is_timing_enabled():
-                        total_time = self.timing_recorder.get_timing("总耗时")
-                        if total_time:
-                            self.ui.update_status(f"OCR识别截图成功，耗时: {total_time:.3f}秒")
-                        else:
-                            self.ui.update_status("OCR识别截图成功")
-                    else:
-                        self.ui.update_status("OCR识别截图成功")
-                    
-                    return True
-                        
-                except Exception as e:
-                    if self.ui.is_timing_enabled():
-                        self.timing_recorder.add_timing("OCR识别", 0)
-                    self.logger.log_message(f"OCR识别出错: {e}", "ERROR")
-                    return False
-            else:
-                self.logger.log_message("警告：OCR处理器未初始化，直接保存原始截图", "ERROR")
-                # 使用传统方式保存
-                success = self.save_screenshot_fallback(screenshot, process_info)
-                return success
+            # 阶段4: OCR识别和保存
+            if defer_ocr:
+                self.submit_auto_frame(screenshot, process_info)
+                return True
+            return self.ocr_and_save(screenshot, process_info)
             
         except Exception as e:
             if self.ui.is_timing_enabled():
@@ -238,15 +273,159 @@ class ProcessCaptureApp:
                 self.logger.log_message(f"截图过程出错: {e}", "ERROR")
             return False
     
+    def ocr_and_save(self, screenshot, process_info: Dict, frame_key: Optional[tuple] = None) -> bool:
+        """OCR识别并保存截图（使用OCRProcessor）
+        
+        Args:
+            screenshot: 截图图像
+            process_info: 进程信息字典
+            frame_key: 自动截图帧的指纹键（识别成功后记录，供后续帧比较；手动截图为None）
+            
+        Returns:
+            是否成功
+        """
+        if self.ocr_processor:
+            if self.ui.is_timing_enabled():
+                self.timing_recorder.start_timing("OCR识别")
+            
+            try:
+                self.logger.log_message("开始OCR文字识别...")
+                
+                # 更新OCR处理器的保存路径
+                self.ocr_processor.set_save_path(self.ui.get_save_path())
+                
+                # 使用OCR处理器进行识别和保存
+                high_confidence_results = self.ocr_processor.recognize_and_save(
+                    screenshot, 
+                    process_info=process_info,
+                    region=self.get_process_region(process_info)
+                )
+                self._last_ocr_results = high_confidence_results
+                self._last_frame_key = frame_key
+                
+                if self.ui.is_timing_enabled():
+                    self.timing_recorder.end_timing("OCR识别")
+                    ocr_time = self.timing_recorder.get_timing("OCR识别")
+                    self.logger.log_message(f"OCR识别完成，耗时: {ocr_time:.3f}秒")
+                
+                # 更新UI状态
+                if self.ui.is_timing_enabled():
+                    total_time = self.timing_recorder.get_timing("总耗时")
+                    if total_time:
+                        self.ui.update_status(f"OCR识别截图成功，耗时: {total_time:.3f}秒")
+                    else:
+                        self.ui.update_status("OCR识别截图成功")
+                else:
+                    self.ui.update_status("OCR识别截图成功")
+                
+                return True
+                    
+            except Exception as e:
+                if self.ui.is_timing_enabled():
+                    self.timing_recorder.add_timing("OCR识别", 0)
+                self.logger.log_message(f"OCR识别出错: {e}", "ERROR")
+                return False
+        else:
+            self.logger.log_message("警告：OCR处理器未初始化，直接保存原始截图", "ERROR")
+            # 使用传统方式保存
+            success = self.save_screenshot_fallback(screenshot, process_info)
+            return success
+    
+    def submit_auto_frame(self, screenshot, process_info: Dict):
+        """提交自动截图的帧到OCR线程，队列已满时丢弃未处理的旧帧
+        
+        Args:
+            screenshot: 截图图像
+            process_info: 进程信息字典
+        """
+        try:
+            self._auto_frames.put_nowait((screenshot, process_info))
+        except queue.Full:
+            try:
+                self._auto_frames.get_nowait()
+            except queue.Empty:
+                pass
+            self._auto_frames.put_nowait((screenshot, process_info))
+            self.logger.log_message("OCR识别跟不上截图间隔，丢弃未处理的旧帧", "WARNING")
+            self.ui.root.after(0, lambda: self.ui.update_status("自动OCR截图进行中... 队列丢帧"))
+    
+    def auto_ocr_loop(self):
+        """自动截图的OCR消费线程：依次识别并保存队列中的最新帧"""
+        while True:
+            screenshot, process_info = self._auto_frames.get()
+            try:
+                frame_key = self.frame_key(screenshot, process_info)
+                if not self.reuse_unchanged_frame(screenshot, process_info, frame_key):
+                    self.ocr_and_save(screenshot, process_info, frame_key)
+            except Exception as e:
+                self.logger.log_message(f"自动截图OCR识别出错: {e}", "ERROR")
+    
+    def frame_key(self, screenshot, process_info: Dict) -> tuple:
+        """计算自动截图帧的指纹键 (窗口句柄, 尺寸, 识别区域, 指纹)"""
+        fingerprint = average_hash(np.asarray(screenshot), size=FRAME_HASH_SIZE)
+        return (process_info['hwnd'], screenshot.size, self.get_process_region(process_info), fingerprint)
+    
+    def reuse_unchanged_frame(self, screenshot, process_info: Dict, frame_key: tuple) -> bool:
+        """画面与最近一次识别的帧相同时复用其OCR结果（只保存，不再识别）
+        
+        比较对象是最近一次实际识别的帧而不是上一帧，画面逐帧缓慢变化时累计差异仍会触发重新识别
+        
+        Args:
+            screenshot: 截图图像
+            process_info: 进程信息字典
+            frame_key: 当前帧的指纹键（frame_key方法的返回值）
+            
+        Returns:
+            是否已复用（False表示需要正常识别）
+        """
+        if not self.ocr_processor:
+            return False
+        
+        last_key = self._last_frame_key
+        if (last_key is None or last_key[:3] != frame_key[:3] or self._last_ocr_results is None or
+                hamming_distance(last_key[3], frame_key[3]) >= FRAME_HASH_DISTANCE):
+            return False
+        
+        self.logger.log_message("画面与上次识别的帧相同，复用上次OCR识别结果")
+        self.ocr_processor.set_save_path(self.ui.get_save_path())
+        self.ocr_processor.save_results(screenshot, self._last_ocr_results, process_info, inplace=True)
+        return True
+    
+    def get_process_region(self, process_info: Dict) -> Optional[tuple]:
+        """获取进程的固定识别区域
+        
+        启用"固定识别区域"时，界面输入的区域会按进程名保存；未输入时沿用该进程上次的区域。
+        
+        Args:
+            process_info: 进程信息字典
+            
+        Returns:
+            (x1, y1, x2, y2)，未启用或无可用区域时返回None
+        """
+        if not self.ui.is_fixed_region_enabled():
+            return None
+        
+        name = process_info['name']
+        region = self.ui.get_fixed_region()
+        if region:
+            self.process_regions[name] = region
+        else:
+            region = self.process_regions.get(name)
+            if region is None:
+                self.logger.log_message("未设置有效的固定识别区域，使用完整识别流程", "WARNING")
+        return region
+    
     def save_screenshot_fallback(self, screenshot, process_info: Dict) -> bool:
         """备用保存方法（当OCR处理器未初始化时）
         
+        文件写入提交到后台I/O线程，调用方立即返回。
+        
         Args:
             screenshot: 截图图像
             process_info: 进程信息
             
         Returns:
-            是否保存成功
+            是否成功提交保存
         """
         try:
             # 确保保存路径存在
@@ -260,11 +439,9 @@ class ProcessCaptureApp:
             
             file_path = os.path.join(save_path, filename)
             
-            # 保存截图
-            screenshot.save(file_path)
+            # 保存截图（后台线程写入）
+            self._save_executor.submit(self._write_png, screenshot, file_path)
             
-            self.logger.log_message(f"截图完成，已保存到: {file_path}")
-            self.logger.log_message("OCR结果: 0 个高置信度文字")
             self.ui.update_status("截图成功（未进行OCR）")
             
             return True
@@ -273,6 +450,23 @@ class ProcessCaptureApp:
             self.logger.log_message(f"备用保存截图失败: {e}", "ERROR")
             return False
     
+    def _write_png(self, screenshot, file_path: str):
+        """写入PNG文件（在I/O线程中执行）
+        
+        Args:
+            screenshot: 截图图像
+            file_path: 保存路径
+        """
+        try:
+            # 64KB缓冲写入减少系统调用；最低压缩级别，编码速度远快于默认级别6
+            with open(file_path, 'wb', buffering=1 << 16) as f:
+                screenshot.save(f, format='PNG', compress_level=1)
+            
+            self.logger.log_message(f"截图完成，已保存到: {file_path}")
+            self.logger.log_message("OCR结果: 0 个高置信度文字")
+        except Exception as e:
+            self.logger.log_message(f"备用保存截图失败: {e}", "ERROR")
+    
     
     def output_timing_statistics(self):
         """输出详细的时间统计"""
@@ -289,6 +483,11 @@ class ProcessCaptureApp:
         except Exception as e:
             self.logger.log_message(f"输出时间统计出错: {e}", "ERROR")
     
+    @property
+    def is_auto_capturing(self) -> bool:
+        """是否正在自动截图"""
+        return not self._stop_event.is_set()
+    
     def start_auto_capture(self) -> bool:
         """开始自动截图
         
@@ -303,52 +502,87 @@ class ProcessCaptureApp:
             self.ui.show_warning("警告", "请先选择一个有效的进程")
             return False
         
-        self.is_auto_capturing = True
+        self._stop_event.clear()
+        self._interval_warned = False
+        self.screenshot_engine.prepare_for_session(self.cached_processes[selection_index]['hwnd'])
         
-        # 启动自动截图线程
-        self.auto_capture_thread = threading.Thread(
-            target=self.auto_capture_loop,
-            args=(self.cached_processes[selection_index],),
-            daemon=True
-        )
-        self.auto_capture_thread.start()
+        # 立即进行第一次截图，之后按间隔调度
+        self._auto_deadline = time.monotonic()
+        self._auto_tick(self.cached_processes[selection_index])
         
         return True
     
     def stop_auto_capture(self):
         """停止自动截图"""
-        self.is_auto_capturing = False
+        self._stop_event.set()
         
-        if self.auto_capture_thread and self.auto_capture_thread.is_alive():
-            self.auto_capture_thread.join(timeout=1)
+        if self._auto_job is not None:
+            self.ui.root.after_cancel(self._auto_job)
+            self._auto_job = None
     
-    def auto_capture_loop(self, process_info: Dict):
-        """自动截图循环
+    def _auto_tick(self, process_info: Dict):
+        """自动截图定时器回调（在Tk线程中执行）：提交一次截图并安排下一次
         
         Args:
             process_info: 进程信息
         """
-        while self.is_auto_capturing:
-            try:
-                success = self.capture_process_window(process_info)
-                
-                if success:
-                    timestamp = datetime.now().strftime('%H:%M:%S')
-                    self.ui.root.after(0, lambda: self.ui.update_status(f"自动OCR截图进行中... 上次截图: {timestamp}"))
-                else:
-                    self.ui.root.after(0, lambda: self.ui.update_status("自动OCR截图进行中... 上次截图失败"))
+        self._auto_job = None
+        if self._stop_event.is_set():
+            return
+        
+        # 上一次截图尚未完成时跳过本次，避免任务堆积
+        if self._auto_future is None or self._auto_future.done():
+            self._auto_future = self._capture_executor.submit(self.auto_capture_once, process_info)
+        
+        # 按截图间隔推进截止时间（不随回调延迟漂移）；落后超过一个间隔时从当前时间重新计时
+        interval = self._get_auto_interval()
+        now = time.monotonic()
+        self._auto_deadline += interval
+        if self._auto_deadline < now:
+            self._auto_deadline = now + interval
+        delay_ms = int((self._auto_deadline - now) * 1000)
+        self._auto_job = self.ui.root.after(delay_ms, self._auto_tick, process_info)
+    
+    def _get_auto_interval(self) -> float:
+        """读取截图间隔；输入无效时沿用上一次的有效值，过小时限制为最小间隔
+        
+        Returns:
+            截图间隔（秒）
+        """
+        try:
+            interval = float(self.ui.get_capture_interval())
+        except (TclError, ValueError):
+            interval = None
+        
+        if interval is None or interval < MIN_CAPTURE_INTERVAL:
+            fallback = self._auto_interval if interval is None else MIN_CAPTURE_INTERVAL
+            if not self._interval_warned:
+                self._interval_warned = True
+                self.logger.log_message(f"截图间隔无效，使用 {fallback} 秒", "WARNING")
+            interval = fallback
+        
+        self._auto_interval = interval
+        return interval
+    
+    def auto_capture_once(self, process_info: Dict):
+        """自动截图的单次截图（在截图执行器线程中执行）
+        
+        Args:
+            process_info: 进程信息
+        """
+        try:
+            success = self.capture_process_window(process_info, defer_ocr=True)
+            
+            if success:
+                timestamp = datetime.now().strftime('%H:%M:%S')
+                self.ui.root.after(0, lambda: self.ui.update_status(f"自动OCR截图进行中... 上次截图: {timestamp}"))
+            else:
+                self.ui.root.after(0, lambda: self.ui.update_status("自动OCR截图进行中... 上次截图失败"))
                 
-                # 等待指定间隔
-                interval = self.ui.get_capture_interval()
-                for _ in range(interval):
-                    if not self.is_auto_capturing:
-                        break
-                    time.sleep(1)
-                    
-            except Exception as e:
-                self.logger.log_message(f"自动截图循环出错: {e}", "ERROR")
-                self.ui.root.after(0, lambda: self.ui.show_error("错误", f"自动截图时出错: {e}"))
-                break
+        except Exception as e:
+            self.logger.log_message(f"自动截图出错: {e}", "ERROR")
+            self.ui.root.after(0, self.stop_auto_capture)
+            self.ui.root.after(0, lambda: self.ui.show_error("错误", f"自动截图时出错: {e}"))
     
     def browse_save_path(self) -> str:
         """浏览保存路径
@@ -369,6 +603,10 @@ class ProcessCaptureApp:
             self.ui.run()
         except Exception as e:
             messagebox.showerror("启动错误", f"程序运行失败: {e}")
+        finally:
+            self.screenshot_engine.close()
+            if self.ocr_processor:
+                self.ocr_processor.close()  # 同时关闭OCR子进程（如果使用）
 
 
 def main():
@@ -15,6 +15,7 @@ OCR截图工具模块化版本
   - process_manager.py: 进程管理
   - screenshot_engine.py: 截图引擎
   - ocr_engine.py: OCR识别引擎
+  - pixel_ops.py: 像素处理内核
 - ui/: 用户界面模块
   - process_capture_ui.py: GUI界面
 - utils/: 工具模块
@@ -4,14 +4,20 @@
 """
 
 # 导入核心模块
-from .process_manager import ProcessManager
+from .process_manager import ProcessManager, ProcessResults
 from .screenshot_engine import ScreenshotEngine
-from .ocr_engine import OCREngine, get_default_ocr_engine, recognize_image
+from .ddupl_engine import DesktopDuplicator
+from .ocr_engine import OCREngine, OCRResults, get_default_ocr_engine, recognize_image
+from .ocr_subprocess import OCRSubprocessClient
 
 __all__ = [
     'ProcessManager',
+    'ProcessResults',
     'ScreenshotEngine', 
+    'DesktopDuplicator',
     'OCREngine',
+    'OCRResults',
     'get_default_ocr_engine',
+    'OCRSubprocessClient',
     'recognize_image'
 ]
\ No newline at end of file
@@ -0,0 +1,137 @@
+"""
+桌面复制截图模块
+功能：通过DXGI桌面复制（DXCam）截取屏幕区域，不可用时回退到mss；
+      适合窗口未被遮挡时的连续截图，无需激活窗口
+"""
+
+import threading
+import numpy as np
+import win32gui
+import win32con
+from typing import Optional
+
+# 可选的截图后端：DXCam（DXGI桌面复制）> mss
+try:
+    import dxcam  # type: ignore
+except ImportError:
+    dxcam = None
+
+try:
+    import mss  # type: ignore
+except ImportError:
+    mss = None
+
+
+class DesktopDuplicator:
+    """桌面复制截图器（DXCam实例只创建一次，后续截图复用其暂存纹理）"""
+
+    def __init__(self, logger=None):
+        """
+        Args:
+            logger: 日志记录器实例
+        """
+        self.logger = logger
+        self._camera = None
+        self._camera_failed = False
+        self._camera_lock = threading.Lock()
+        self._mss_local = threading.local()  # mss实例不能跨线程使用
+
+    def log_message(self, message: str, level: str = "INFO"):
+        """记录日志消息"""
+        if self.logger:
+            self.logger.log_message(message, level)
+        else:
+            print(f"[{level}] {message}")
+
+    @property
+    def available(self) -> bool:
+        """是否安装了任一桌面截图后端"""
+        return dxcam is not None or mss is not None
+
+    def _get_camera(self):
+        """首次使用时创建DXCam实例，失败后不再重试"""
+        if self._camera is None and not self._camera_failed and dxcam is not None:
+            with self._camera_lock:
+                if self._camera is None and not self._camera_failed:
+                    try:
+                        self._camera = dxcam.create(output_color="RGB")
+                    except Exception as e:
+                        self.log_message(f"DXCam初始化失败，回退到mss: {e}", "WARNING")
+                        self._camera_failed = True
+        return self._camera
+
+    @staticmethod
+    def is_window_unobscured(hwnd, rect: tuple) -> bool:
+        """粗略判断窗口是否未被其他窗口遮挡（检查四角与中心点所属的顶层窗口）
+
+        Args:
+            hwnd: 窗口句柄
+            rect: 窗口矩形 (left, top, right, bottom)
+
+        Returns:
+            采样点是否都落在该窗口上
+        """
+        if win32gui.IsIconic(hwnd):
+            return False
+        left, top, right, bottom = rect
+        points = [
+            (left + 8, top + 8), (right - 9, top + 8),
+            (left + 8, bottom - 9), (right - 9, bottom - 9),
+            ((left + right) // 2, (top + bottom) // 2)
+        ]
+        for point in points:
+            try:
+                owner = win32gui.WindowFromPoint(point)
+            except Exception:
+                return False
+            if not owner or win32gui.GetAncestor(owner, win32con.GA_ROOT) != hwnd:
+                return False
+        return True
+
+    def grab(self, bbox: tuple) -> Optional[np.ndarray]:
+        """截取屏幕区域
+
+        Args:
+            bbox: 截图区域 (left, top, right, bottom)，屏幕坐标
+
+        Returns:
+            RGB像素数组 (H, W, 3)，所有后端都失败时返回None
+        """
+        camera = self._get_camera()
+        if camera is not None:
+            left, top, right, bottom = bbox
+            # DXCam只能截取主输出范围内的区域，超出时交给mss处理虚拟屏幕坐标
+            if left >= 0 and top >= 0 and right <= camera.width and bottom <= camera.height:
+                try:
+                    # 画面与上一帧相同时DXCam返回None，此时回退到mss
+                    frame = camera.grab(region=bbox)
+                except Exception as e:
+                    self.log_message(f"DXCam截图失败: {e}", "WARNING")
+                    frame = None
+                if frame is not None:
+                    return frame
+
+        if mss is not None:
+            try:
+                sct = getattr(self._mss_local, 'sct', None)
+                if sct is None:
+                    sct = self._mss_local.sct = mss.mss()
+                left, top, right, bottom = bbox
+                shot = sct.grab({'left': left, 'top': top, 'width': right - left, 'height': bottom - top})
+                return np.asarray(shot)[:, :, 2::-1]  # BGRA -> RGB 视图，不复制
+            except Exception as e:
+                self.log_message(f"mss截图失败: {e}", "WARNING")
+        return None
+
+    def close(self):
+        """释放DXCam实例"""
+        with self._camera_lock:
+            if self._camera is not None:
+                try:
+                    self._camera.release()
+                except Exception:
+                    pass
+                self._camera = None
+
+
+__all__ = ['DesktopDuplicator']
@@ -3,20 +3,118 @@ OCR引擎封装模块
 提供统一的OCR识别接口，支持图像文件和像素数组识别
 """
 
+import os
+
+# Paddle在导入时读取这些环境变量，必须在导入paddleocr之前设置（用户已设置的值优先）：
+# 启用oneDNN(MKLDNN)内核；限制OpenMP线程数，避免与Tk及截图线程争抢CPU
+os.environ.setdefault("FLAGS_use_mkldnn", "1")
+os.environ.setdefault("OMP_NUM_THREADS", str(max(1, (os.cpu_count() or 2) // 2)))
+# 关闭NPU算子的JIT编译，避免首次推理长时间编译
+os.environ.setdefault("FLAGS_npu_jit_compile", "0")
+
 import numpy as np
 from PIL import Image
 import cv2  # type: ignore
 from paddleocr import PaddleOCR
+try:
+    # 检测框裁剪与排序工具函数（PaddleOCR 2.x 随包发布的tools模块）
+    from paddleocr.tools.infer.utility import get_rotate_crop_image  # type: ignore
+    from paddleocr.tools.infer.predict_system import sorted_boxes  # type: ignore
+except ImportError:
+    get_rotate_crop_image = sorted_boxes = None
 from typing import List, Dict, Optional, Union, Tuple
-import os
+import queue
+import threading
+from concurrent.futures import Future
+from .pixel_ops import rgb_to_bgr
+
+class OCRResults:
+    """OCR识别结果集合（结构数组布局：文本、置信度、文字框分别连续存放）
+    
+    按整数下标访问或遍历时返回 {'text', 'confidence', 'box'} 字典（兼容原来的结果列表接口，
+    每次访问新建，需要批量读取时直接使用各列）；切片返回OCRResults子集；
+    批量计算（筛选、坐标缩放、包围框）直接使用confs/boxes数组。
+    """
+    
+    __slots__ = ('texts', 'confs', 'boxes')
+    
+    def __init__(self,
+                 texts: Optional[List[str]] = None,
+                 confs: Optional[np.ndarray] = None,
+                 boxes: Optional[np.ndarray] = None):
+        """
+        Args:
+            texts: 文本列表
+            confs: (N,) float64 置信度数组
+            boxes: (N, 4, 2) float32 文字框顶点数组
+        """
+        self.texts = texts if texts is not None else []
+        self.confs = confs if confs is not None else np.empty(0, dtype=np.float64)
+        self.boxes = boxes if boxes is not None else np.empty((0, 4, 2), dtype=np.float32)
+    
+    @classmethod
+    def from_lines(cls, lines) -> 'OCRResults':
+        """从PaddleOCR单张图像的结果构建
+        
+        Args:
+            lines: 每行格式: [[[x1,y1],[x2,y2],[x3,y3],[x4,y4]], (text, confidence)]
+        """
+        n = len(lines)
+        if n == 0:
+            return cls()
+        return cls(
+            [line[1][0] for line in lines],
+            np.fromiter((line[1][1] for line in lines), dtype=np.float64, count=n),
+            np.array([line[0] for line in lines], dtype=np.float32).reshape(n, -1, 2)
+        )
+    
+    def take(self, indices) -> 'OCRResults':
+        """按下标数组取出子集"""
+        return OCRResults([self.texts[i] for i in indices], self.confs[indices], self.boxes[indices])
+    
+    def filter(self, threshold: float) -> 'OCRResults':
+        """返回置信度高于阈值的子集"""
+        return self.take(np.flatnonzero(self.confs > threshold))
+    
+    def __len__(self) -> int:
+        return len(self.texts)
+    
+    def __getitem__(self, i: Union[int, slice]) -> Union[Dict, 'OCRResults']:
+        if isinstance(i, slice):
+            return OCRResults(self.texts[i], self.confs[i], self.boxes[i])
+        return {
+            'text': self.texts[i],
+            'confidence': float(self.confs[i]),
+            'box': self.boxes[i].tolist()
+        }
+    
+    def __iter__(self):
+        # 各列一次转换为Python对象后逐行组合，不再逐个下标访问数组
+        for text, confidence, box in zip(self.texts, self.confs.tolist(), self.boxes.tolist()):
+            yield {'text': text, 'confidence': confidence, 'box': box}
+    
+    def __repr__(self) -> str:
+        return f"OCRResults({list(self)!r})"
+
 
 class OCREngine:
     """OCR识别引擎类"""
     
+    # 默认输入图像长边上限（与PaddleOCR检测模型默认的det_limit_side_len一致），超过时先缩小再识别
+    MAX_SIDE_LEN = 1280
+    # 待识别任务队列上限，队列满时提交方阻塞等待
+    QUEUE_SIZE = 4
+    
     def __init__(self, 
                  lang: str = "ch",
                  use_gpu: bool = False,
-                 confidence_threshold: float = 0.8):
+                 confidence_threshold: float = 0.8,
+                 enable_mkldnn: bool = True,
+                 cpu_threads: Optional[int] = None,
+                 precision: str = "fp32",
+                 det_model_dir: Optional[str] = None,
+                 rec_model_dir: Optional[str] = None,
+                 max_side: int = MAX_SIDE_LEN):
         """
         初始化OCR引擎
         
@@ -24,14 +122,37 @@ class OCREngine:
             lang: 语言模式，默认中文 "ch"
             use_gpu: 是否使用GPU，默认False
             confidence_threshold: 置信度阈值，默认0.8
+            enable_mkldnn: CPU推理时是否启用MKLDNN(oneDNN)加速，默认True
+            cpu_threads: CPU推理线程数，默认为CPU核心数的一半
+            precision: 推理精度 "fp32" / "fp16" / "int8"，int8需配合量化模型使用
+            det_model_dir: 检测模型目录（如PaddleSlim导出的INT8量化模型），默认使用内置模型
+            rec_model_dir: 识别模型目录，默认使用内置模型
+            max_side: 输入图像长边上限，超过时先缩小再识别，默认1280
         """
         self.lang = lang
         self.use_gpu = use_gpu
         self.confidence_threshold = confidence_threshold
+        self.enable_mkldnn = enable_mkldnn and not use_gpu
+        self.cpu_threads = cpu_threads or max(1, (os.cpu_count() or 2) // 2)
+        self.precision = precision
+        self.det_model_dir = det_model_dir
+        self.rec_model_dir = rec_model_dir
+        self.max_side = max_side
         self.ocr = None
+        self._det = None  # 文字检测器（直接调用，绕过ocr()的通用流程）
+        self._rec = None  # 文字识别器
+        self._bgr_buf = None  # 复用的BGR转换缓冲区（仅在工作线程中使用）
         
         print("正在初始化OCR模型...")
         self._init_ocr()
+        
+        # PaddleOCR预测器非线程安全：所有识别都交给常驻工作线程串行执行
+        self._queue = queue.Queue(maxsize=self.QUEUE_SIZE)
+        self._worker = threading.Thread(target=self._loop, name="OCRWorker", daemon=True)
+        self._worker.start()
+        
+        # 后台预热：预热任务排在工作线程队首，不阻塞初始化
+        self.warm_up(wait=False)
     
     def _init_ocr(self):
         """初始化PaddleOCR模型"""
@@ -39,19 +160,162 @@ class OCREngine:
             device = "gpu" if self.use_gpu else "cpu"
             
             # 使用标准模式，经测试验证最优
-            self.ocr = PaddleOCR(
+            options = dict(
                 use_angle_cls=True,
                 use_gpu=self.use_gpu,
                 lang=self.lang,
+                enable_mkldnn=self.enable_mkldnn,
+                cpu_threads=self.cpu_threads,
+                precision=self.precision,
                 show_log=False
             )
-            print(f"OCR模型初始化完成 (语言: {self.lang}, 设备: {device})")
+            model_dirs = {'det_model_dir': self.det_model_dir, 'rec_model_dir': self.rec_model_dir}
+            missing = [d for d in model_dirs.values() if d and not self._has_inference_model(d)]
+            if missing:
+                # 量化模型文件缺失时回退到内置的FP32模型
+                print(f"模型文件不存在: {', '.join(missing)}，回退到内置FP32模型")
+                self.precision = options['precision'] = "fp32"
+            elif self.precision == "int8" and not any(model_dirs.values()):
+                # 内置模型未经量化，int8精度无意义
+                print("未指定INT8量化模型目录，使用FP32精度")
+                self.precision = options['precision'] = "fp32"
+            else:
+                options.update({k: v for k, v in model_dirs.items() if v})
+            
+            try:
+                self.ocr = PaddleOCR(**options)
+            except Exception as e:
+                if not self.enable_mkldnn:
+                    raise
+                # 部分Paddle构建不含MKLDNN，回退到默认CPU内核
+                print(f"启用MKLDNN失败，回退到默认CPU推理: {e}")
+                self.enable_mkldnn = options['enable_mkldnn'] = False
+                self.ocr = PaddleOCR(**options)
+            if get_rotate_crop_image is not None:
+                self._det = getattr(self.ocr, 'text_detector', None)
+                self._rec = getattr(self.ocr, 'text_recognizer', None)
+            print(f"OCR模型初始化完成 (语言: {self.lang}, 设备: {device}, "
+                  f"MKLDNN: {self.enable_mkldnn}, 线程数: {self.cpu_threads}, 精度: {self.precision})")
                 
         except Exception as e:
             print(f"OCR模型初始化失败: {e}")
             self.ocr = None
     
-    def recognize_image_file(self, image_path: str) -> List[Dict]:
+    @staticmethod
+    def _has_inference_model(model_dir: str) -> bool:
+        """检查目录下是否存在导出的推理模型文件"""
+        return os.path.isfile(os.path.join(model_dir, "inference.pdmodel"))
+    
+    def _loop(self):
+        """OCR工作线程：依次取出任务执行识别，并通过Future返回结果"""
+        while True:
+            img_input, to_bgr, det, future = self._queue.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                if to_bgr:
+                    # RGB/RGBA转换为BGR：单次遍历，写入复用的缓冲区
+                    img_input = self._bgr_buf = rgb_to_bgr(img_input, self._bgr_buf)
+                if det and self._det is not None and self._rec is not None \
+                        and isinstance(img_input, np.ndarray) and img_input.ndim == 3 and img_input.shape[2] == 3:
+                    future.set_result(self._detect_and_recognize(img_input))
+                else:
+                    future.set_result(self.ocr.ocr(img_input, det=det, cls=False))  # type: ignore
+            except Exception as e:
+                future.set_exception(e)
+    
+    def _detect_and_recognize(self, img_bgr: np.ndarray) -> list:
+        """直接调用检测器和识别器完成一次识别（在工作线程中调用）
+        
+        等价于 ocr(img, cls=False)，但跳过其中的输入类型判断、图像预处理和方向分类等通用流程。
+        
+        Args:
+            img_bgr: (H, W, 3) BGR像素数组
+            
+        Returns:
+            与PaddleOCR.ocr()相同格式的结果: [[[box, (text, confidence)], ...]]
+        """
+        dt_boxes, _ = self._det(img_bgr)
+        if dt_boxes is None or len(dt_boxes) == 0:
+            return [[]]
+        
+        dt_boxes = sorted_boxes(dt_boxes)
+        crops = [get_rotate_crop_image(img_bgr, box.copy()) for box in dt_boxes]
+        rec_res, _ = self._rec(crops)
+        
+        # 与ocr()一致：丢弃低于drop_score的结果
+        drop_score = getattr(self.ocr, 'drop_score', 0.5)
+        return [[
+            [box.tolist(), (text, score)]
+            for box, (text, score) in zip(dt_boxes, rec_res)
+            if score >= drop_score
+        ]]
+    
+    def _submit(self, img_input, to_bgr: bool = False, det: bool = True) -> Future:
+        """提交一次PaddleOCR识别到工作线程
+        
+        Args:
+            img_input: 图像文件路径或像素数组
+            to_bgr: 是否在识别前将RGB(A)像素转换为BGR
+            det: 是否执行文字检测，为False时整幅图像直接送入识别模型
+            
+        Returns:
+            识别结果的Future
+        """
+        future = Future()
+        self._queue.put((img_input, to_bgr, det, future))
+        return future
+    
+    def _run_ocr(self, img_input, to_bgr: bool = False, det: bool = True):
+        """提交一次PaddleOCR识别到工作线程并等待结果（参数同_submit）"""
+        return self._submit(img_input, to_bgr, det).result()
+    
+    def warm_up(self, wait: bool = True):
+        """用空白图像执行一次识别，提前加载模型权重并完成算子初始化
+        
+        首次识别会触发模型加载和内核选择，耗时数秒；初始化时已自动在后台提交一次预热。
+        
+        Args:
+            wait: 是否等待预热完成
+        """
+        if self.ocr is None:
+            return
+        future = self._submit(np.zeros((64, 64, 3), dtype=np.uint8))
+        future.add_done_callback(self._report_warm_up)
+        if wait:
+            try:
+                future.result()
+            except Exception:
+                pass  # 已在回调中输出
+    
+    @staticmethod
+    def _report_warm_up(future: Future):
+        """输出预热结果"""
+        error = future.exception()
+        if error is None:
+            print("OCR模型预热完成")
+        else:
+            print(f"OCR模型预热失败: {error}")
+    
+    def _downscale(self, img_array: np.ndarray) -> Tuple[np.ndarray, float]:
+        """长边超过上限时用cv2 INTER_AREA缩小图像
+        
+        Returns:
+            (缩放后的图像, 缩放比例)，无需缩放时比例为1.0
+        """
+        longest = max(img_array.shape[:2])
+        if longest <= self.max_side:
+            return img_array, 1.0
+        
+        scale = self.max_side / longest
+        resized = cv2.resize(img_array, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        return resized, scale
+    
+    def _rescale_boxes(self, results: OCRResults, factor: float):
+        """按比例缩放识别结果中的文字框坐标（原地修改）"""
+        results.boxes *= factor
+    
+    def recognize_image_file(self, image_path: str) -> OCRResults:
         """
         识别图像文件中的文字
         
@@ -59,25 +323,25 @@ class OCREngine:
             image_path: 图像文件路径
             
         Returns:
-            识别结果列表，每个元素包含text, confidence, box信息
+            识别结果（OCRResults），每项包含text, confidence, box信息
         """
         if not os.path.exists(image_path):
             print(f"图像文件不存在: {image_path}")
-            return []
+            return OCRResults()
         
         if self.ocr is None:
             print("OCR模型未初始化，无法进行识别")
-            return []
+            return OCRResults()
         
         try:
             print(f"正在识别图像文件: {image_path}")
-            result = self.ocr.ocr(image_path, cls=False)  # type: ignore
+            result = self._run_ocr(image_path)
             return self._parse_ocr_result(result)
         except Exception as e:
             print(f"识别图像文件时出错: {e}")
-            return []
+            return OCRResults()
     
-    def recognize_image_array(self, img_array: np.ndarray) -> List[Dict]:
+    def recognize_image_array(self, img_array: np.ndarray) -> OCRResults:
         """
         识别像素数组中的文字
         
@@ -85,24 +349,39 @@ class OCREngine:
             img_array: 图像像素数组 (numpy.ndarray)
             
         Returns:
-            识别结果列表，每个元素包含text, confidence, box信息
+            识别结果（OCRResults），每项包含text, confidence, box信息
+        """
+        return self._recognize_array(img_array, to_bgr=False)
+    
+    def _recognize_array(self, img_array: np.ndarray, to_bgr: bool) -> OCRResults:
+        """内部方法：识别像素数组，返回高置信度结果"""
+        return self._recognize_array_all(img_array, to_bgr)[1]
+    
+    def _recognize_array_all(self, img_array: np.ndarray, to_bgr: bool) -> Tuple[OCRResults, OCRResults]:
+        """内部方法：缩放、识别像素数组并还原文字框坐标
+        
+        Returns:
+            (所有结果, 高置信度结果) 的元组
         """
         if self.ocr is None:
             print("OCR模型未初始化，无法进行识别")
-            return []
+            return OCRResults(), OCRResults()
         
         try:
             print(f"正在识别图像数组，尺寸: {img_array.shape}")
             
+            # 大图先缩小，识别后将文字框坐标还原到原图尺寸
+            img_array, scale = self._downscale(img_array)
+            
             # 执行OCR识别
-            result = self.ocr.ocr(img_array, cls=False)  # type: ignore
-            return self._parse_ocr_result(result)
+            result = self._run_ocr(img_array, to_bgr=to_bgr)
+            return self._split_results(result, 1.0 / scale)
             
         except Exception as e:
             print(f"识别图像数组时出错: {e}")
-            return []
+            return OCRResults(), OCRResults()
     
-    def recognize_pil_image(self, pil_image: Image.Image) -> List[Dict]:
+    def recognize_pil_image(self, pil_image: Image.Image) -> OCRResults:
         """
         识别PIL图像中的文字
         
@@ -110,13 +389,63 @@ class OCREngine:
             pil_image: PIL Image对象
             
         Returns:
-            识别结果列表，每个元素包含text, confidence, box信息
+            识别结果（OCRResults），每项包含text, confidence, box信息
         """
-        # 转换PIL图像为numpy数组
-        img_array = np.array(pil_image)
-        return self.recognize_image_array(img_array)
+        # 转换PIL图像为numpy数组（asarray不再额外复制，识别过程只读取像素）
+        img_array = np.asarray(pil_image)
+        
+        # RGB/RGBA到BGR的转换在工作线程中完成
+        to_bgr = img_array.ndim == 3 and img_array.shape[2] in (3, 4)
+        return self._recognize_array(img_array, to_bgr=to_bgr)
     
-    def _parse_ocr_result(self, result) -> List[Dict]:
+    def recognize_region(self, img: Union[np.ndarray, Image.Image],
+                         box: Optional[Tuple[int, int, int, int]] = None) -> OCRResults:
+        """
+        识别固定区域中的文字（跳过文字检测，区域内容直接送入识别模型）
+        
+        适用于窗口中只有一处位置固定的文字的场景，省去检测模型的耗时。
+        
+        Args:
+            img: 图像像素数组或PIL图像
+            box: 识别区域 (x1, y1, x2, y2)，为None时走完整的检测+识别流程
+            
+        Returns:
+            识别结果列表（最多一项），box为区域四角坐标
+        """
+        is_pil = isinstance(img, Image.Image)
+        img_array = np.asarray(img)
+        to_bgr = is_pil and img_array.ndim == 3 and img_array.shape[2] in (3, 4)
+        if box is None:
+            return self._recognize_array(img_array, to_bgr=to_bgr)
+        
+        if self.ocr is None:
+            print("OCR模型未初始化，无法进行识别")
+            return OCRResults()
+        
+        try:
+            x1, y1, x2, y2 = box
+            crop = img_array[y1:y2, x1:x2]  # 切片视图，不复制像素
+            if crop.size == 0:
+                print(f"识别区域超出图像范围: {box}")
+                return OCRResults()
+            
+            result = self._run_ocr(np.ascontiguousarray(crop), to_bgr=to_bgr, det=False)
+            if not result or not result[0]:
+                return OCRResults()
+            
+            text, confidence = result[0][0]
+            if confidence <= self.confidence_threshold:
+                return OCRResults()
+            return OCRResults(
+                [text],
+                np.array([confidence], dtype=np.float64),
+                np.array([[[x1, y1], [x2, y1], [x2, y2], [x1, y2]]], dtype=np.float32)
+            )
+        except Exception as e:
+            print(f"识别固定区域时出错: {e}")
+            return OCRResults()
+    
+    def _parse_ocr_result(self, result) -> OCRResults:
         """
         解析OCR识别结果
         
@@ -124,50 +453,36 @@ class OCREngine:
             result: PaddleOCR原始识别结果
             
         Returns:
-            格式化的识别结果列表
+            高置信度识别结果
+        """
+        return self._split_results(result)[1]
+    
+    def _split_results(self, result, factor: float = 1.0) -> Tuple[OCRResults, OCRResults]:
+        """
+        解析OCR识别结果，一次构建所有结果并按置信度掩码取出高置信度子集
+        
+        Args:
+            result: PaddleOCR原始识别结果
+            factor: 文字框坐标缩放比例（识别前缩小过图像时用于还原坐标）
+            
+        Returns:
+            (所有结果, 高置信度结果) 的元组
         """
         if not result or not result[0]:
             print("未识别到任何文字")
-            return []
-        
-        parsed_results = []
-        high_confidence_results = []
-        
-       # print("\n=== OCR识别结果 ===")
-        for line in result[0]:
-            try:
-                # line格式: [[[x1,y1],[x2,y2],[x3,y3],[x4,y4]], (text, confidence)]
-                box = line[0]
-                text = line[1][0]
-                confidence = line[1][1]
-                
-               # print(f"文本: {text}, 置信度: {confidence:.3f}")
-                
-                result_item = {
-                    'text': text,
-                    'confidence': confidence,
-                    'box': box
-                }
-                parsed_results.append(result_item)
-                
-                # 筛选高置信度结果
-                if confidence > self.confidence_threshold:
-                    high_confidence_results.append(result_item)
-                    
-            except (IndexError, KeyError) as e:
-                print(f"解析识别结果时出错: {e}")
-                continue
+            return OCRResults(), OCRResults()
         
-        # print(f"\n=== 高置信度结果 (>{self.confidence_threshold}) ===")
-        # if high_confidence_results:
-        #     for i, item in enumerate(high_confidence_results, 1):
-        #         print(f"{i}. 文本: {item['text']}, 置信度: {item['confidence']:.3f}")
-        # else:
-        #     print(f"没有找到置信度大于{self.confidence_threshold}的识别结果")
+        try:
+            all_results = OCRResults.from_lines(result[0])
+        except (IndexError, KeyError, TypeError, ValueError) as e:
+            print(f"解析识别结果时出错: {e}")
+            return OCRResults(), OCRResults()
         
-        return high_confidence_results
+        if factor != 1.0:
+            self._rescale_boxes(all_results, factor)
+        return all_results, all_results.filter(self.confidence_threshold)
     
-    def get_all_results(self, img_input: Union[str, np.ndarray, Image.Image]) -> Tuple[List[Dict], List[Dict]]:
+    def get_all_results(self, img_input: Union[str, np.ndarray, Image.Image]) -> Tuple[OCRResults, OCRResults]:
         """
         获取所有识别结果和高置信度结果
         
@@ -179,63 +494,37 @@ class OCREngine:
         """
         if isinstance(img_input, str):
             # 文件路径
-            all_results = self._recognize_and_get_all(img_input, 'file')
+            return self._recognize_and_get_all(img_input, 'file')
         elif isinstance(img_input, np.ndarray):
             # numpy数组
-            all_results = self._recognize_and_get_all(img_input, 'array')
+            return self._recognize_and_get_all(img_input, 'array')
         elif isinstance(img_input, Image.Image):
             # PIL图像
-            all_results = self._recognize_and_get_all(img_input, 'pil')
+            return self._recognize_and_get_all(img_input, 'pil')
         else:
             print(f"不支持的图像输入类型: {type(img_input)}")
-            return [], []
-        
-        high_confidence_results = [
-            item for item in all_results 
-            if item['confidence'] > self.confidence_threshold
-        ]
-        
-        return all_results, high_confidence_results
+            return OCRResults(), OCRResults()
     
-    def _recognize_and_get_all(self, img_input, input_type: str) -> List[Dict]:
-        """内部方法：识别并获取所有结果"""
+    def _recognize_and_get_all(self, img_input, input_type: str) -> Tuple[OCRResults, OCRResults]:
+        """内部方法：识别并获取 (所有结果, 高置信度结果)"""
         if self.ocr is None:
-            return []
+            return OCRResults(), OCRResults()
+        
+        if input_type == 'array':
+            return self._recognize_array_all(img_input, to_bgr=False)
+        elif input_type == 'pil':
+            # 与recognize_pil_image一致：零拷贝转换，BGR转换在工作线程中完成
+            img_array = np.asarray(img_input)
+            to_bgr = img_array.ndim == 3 and img_array.shape[2] in (3, 4)
+            return self._recognize_array_all(img_array, to_bgr=to_bgr)
+        elif input_type != 'file':
+            return OCRResults(), OCRResults()
         
         try:
-            if input_type == 'file':
-                result = self.ocr.ocr(img_input, cls=False)  # type: ignore
-            elif input_type == 'array':
-                result = self.ocr.ocr(img_input, cls=False)  # type: ignore
-            elif input_type == 'pil':
-                img_array = np.array(img_input)
-                result = self.ocr.ocr(img_array, cls=False)  # type: ignore
-            else:
-                return []
-            
-            if not result or not result[0]:
-                return []
-            
-            all_results = []
-            for line in result[0]:
-                try:
-                    box = line[0]
-                    text = line[1][0]
-                    confidence = line[1][1]
-                    
-                    all_results.append({
-                        'text': text,
-                        'confidence': confidence,
-                        'box': box
-                    })
-                except (IndexError, KeyError):
-                    continue
-            
-            return all_results
-            
+            return self._split_results(self._run_ocr(img_input))
         except Exception as e:
             print(f"识别过程中出错: {e}")
-            return []
+            return OCRResults(), OCRResults()
     
     def set_confidence_threshold(self, threshold: float):
         """设置置信度阈值"""
@@ -251,16 +540,25 @@ class OCREngine:
 
 # 创建默认OCR引擎实例
 default_ocr_engine = None
+_default_engine_lock = threading.Lock()
 
-def get_default_ocr_engine() -> OCREngine:
-    """获取默认OCR引擎实例（单例模式）"""
+def get_default_ocr_engine(**kwargs) -> OCREngine:
+    """获取默认OCR引擎实例（单例模式，进程内只加载一次模型）
+    
+    Args:
+        **kwargs: 首次创建时传给OCREngine的参数，实例已存在时忽略
+        
+    Returns:
+        OCREngine实例
+    """
     global default_ocr_engine
-    if default_ocr_engine is None:
-        default_ocr_engine = OCREngine()
+    with _default_engine_lock:
+        if default_ocr_engine is None:
+            default_ocr_engine = OCREngine(**kwargs)
     return default_ocr_engine
 
 def recognize_image(img_input: Union[str, np.ndarray, Image.Image], 
-                   confidence_threshold: float = 0.8) -> List[Dict]:
+                   confidence_threshold: float = 0.8) -> OCRResults:
     """
     便捷函数：识别图像并返回高置信度结果
     
@@ -282,10 +580,11 @@ def recognize_image(img_input: Union[str, np.ndarray, Image.Image],
         return engine.recognize_pil_image(img_input)
     else:
         print(f"不支持的图像输入类型: {type(img_input)}")
-        return []
+        return OCRResults()
 
 # 导出主要接口
 __all__ = [
+    'OCRResults',
     'OCREngine',
     'get_default_ocr_engine', 
     'recognize_image'
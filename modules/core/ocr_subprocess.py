@@ -0,0 +1,208 @@
+"""
+OCR子进程模块
+功能：在独立的Python进程中运行OCR引擎，截图像素通过共享内存传递（不经过pickle复制），
+      识别的前后处理不再与Tk主循环、截图线程争抢同一个GIL
+"""
+
+import multiprocessing as mp
+import queue
+import threading
+import numpy as np
+from PIL import Image
+from typing import Optional, Tuple, Union
+
+try:
+    from multiprocessing import shared_memory  # Python 3.8+
+except ImportError:
+    shared_memory = None
+
+from .ocr_engine import OCRResults
+
+# 等待子进程返回识别结果的超时时间（秒），首次请求包含模型加载与预热
+RESULT_TIMEOUT = 120.0
+
+
+def _ocr_worker_main(requests, responses, engine_kwargs: dict):
+    """子进程入口：加载OCR引擎，循环处理识别请求
+
+    Args:
+        requests: 请求队列，每项为 (req_id, shm_name, shape, dtype, box)，None表示退出
+        responses: 结果队列，每项为 (req_id, texts, confs, boxes, error)，error为出错信息或None
+        engine_kwargs: 传给OCREngine的参数
+    """
+    from .ocr_engine import OCREngine
+    from .pixel_ops import rgb_to_bgr
+
+    engine = OCREngine(**engine_kwargs)
+    shm = None
+    bgr_buf = None
+    try:
+        while True:
+            request = requests.get()
+            if request is None:
+                break
+            req_id, shm_name, shape, dtype, box = request
+            error = None
+            try:
+                # 共享内存段只在父进程扩容时更换，其余请求复用已映射的段
+                if shm is None or shm.name != shm_name:
+                    if shm is not None:
+                        shm.close()
+                    shm = shared_memory.SharedMemory(name=shm_name)
+                pixels = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+                # 转换结果写入本进程的缓冲区，父进程可立即复用共享内存
+                if pixels.ndim == 3 and pixels.shape[2] in (3, 4):
+                    bgr_buf = rgb_to_bgr(pixels, bgr_buf)
+                else:
+                    bgr_buf = pixels.copy()
+                del pixels
+                if box is None:
+                    results = engine.recognize_image_array(bgr_buf)
+                else:
+                    results = engine.recognize_region(bgr_buf, box)
+            except Exception as e:
+                # 子进程没有界面日志，出错信息随结果返回由父进程记录
+                error = f"OCR子进程识别出错: {e}"
+                results = OCRResults()
+            responses.put((req_id, results.texts, results.confs, results.boxes, error))
+    finally:
+        if shm is not None:
+            shm.close()
+
+
+class OCRSubprocessClient:
+    """OCR子进程客户端，提供与OCREngine一致的识别接口"""
+
+    def __init__(self, confidence_threshold: float = 0.8, logger=None, **engine_kwargs):
+        """
+        启动OCR子进程
+
+        Args:
+            confidence_threshold: 置信度阈值
+            logger: 日志记录器实例
+            **engine_kwargs: 传给子进程中OCREngine的其余参数（lang, use_gpu等）
+        """
+        if shared_memory is None:
+            raise RuntimeError("OCR子进程需要Python 3.8及以上版本（multiprocessing.shared_memory）")
+
+        self.confidence_threshold = confidence_threshold
+        self.logger = logger
+        engine_kwargs["confidence_threshold"] = confidence_threshold
+
+        # spawn上下文：Windows上唯一可用的启动方式，其他平台保持一致，避免fork继承Tk状态
+        ctx = mp.get_context("spawn")
+        self._requests = ctx.Queue()
+        self._responses = ctx.Queue()
+        self._process = ctx.Process(
+            target=_ocr_worker_main,
+            args=(self._requests, self._responses, engine_kwargs),
+            name="OCRSubprocess",
+            daemon=True
+        )
+        self._process.start()
+
+        self._shm = None  # 图像共享内存（按需扩容，所有请求复用）
+        # 超时请求占用的共享内存 {req_id: shm}，子进程可能仍在读取，收到迟到的结果后才释放
+        self._stale_shm = {}
+        self._req_id = 0
+        self._lock = threading.Lock()  # 共享内存同一时间只承载一个请求
+
+    def log_message(self, message: str, level: str = "INFO"):
+        """记录日志消息"""
+        if self.logger:
+            self.logger.log_message(message, level)
+        else:
+            print(f"[{level}] {message}")
+
+    def _ensure_shm(self, nbytes: int):
+        """确保共享内存段不小于nbytes"""
+        if self._shm is not None and self._shm.size >= nbytes:
+            return
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+        self._shm = shared_memory.SharedMemory(create=True, size=nbytes)
+
+    def _recognize(self, img: Union[np.ndarray, Image.Image],
+                   box: Optional[Tuple[int, int, int, int]] = None) -> OCRResults:
+        """将RGB(A)像素写入共享内存并等待子进程返回结果"""
+        if not self._process.is_alive():
+            self.log_message("OCR子进程已退出，无法进行识别", "ERROR")
+            return OCRResults()
+
+        img_array = np.asarray(img)
+        with self._lock:
+            self._ensure_shm(img_array.nbytes)
+            shared = np.ndarray(img_array.shape, dtype=img_array.dtype, buffer=self._shm.buf)
+            shared[...] = img_array
+            del shared
+
+            self._req_id += 1
+            req_id = self._req_id
+            self._requests.put((req_id, self._shm.name, img_array.shape, img_array.dtype.str, box))
+
+            while True:
+                try:
+                    resp_id, texts, confs, boxes, error = self._responses.get(timeout=RESULT_TIMEOUT)
+                except queue.Empty:
+                    # 子进程可能仍在读取该段，保留到迟到的结果返回，下一次请求改用新段
+                    self._stale_shm[req_id] = self._shm
+                    self._shm = None
+                    self.log_message("等待OCR子进程结果超时", "ERROR")
+                    return OCRResults()
+                if error:
+                    self.log_message(error, "ERROR")
+                if resp_id == req_id:
+                    return OCRResults(texts, confs, boxes)
+                # 之前超时请求迟到的结果：丢弃结果，释放其占用的共享内存
+                stale = self._stale_shm.pop(resp_id, None)
+                if stale is not None:
+                    stale.close()
+                    stale.unlink()
+
+    def recognize_pil_image(self, pil_image: Image.Image) -> OCRResults:
+        """
+        识别PIL图像中的文字
+
+        Args:
+            pil_image: PIL Image对象（RGB/RGBA）
+
+        Returns:
+            高置信度识别结果（OCRResults）
+        """
+        return self._recognize(pil_image)
+
+    def recognize_region(self, img: Union[np.ndarray, Image.Image],
+                         box: Optional[Tuple[int, int, int, int]] = None) -> OCRResults:
+        """
+        识别固定区域中的文字（跳过文字检测）
+
+        Args:
+            img: RGB(A)像素数组或PIL图像
+            box: 识别区域 (x1, y1, x2, y2)，为None时走完整的检测+识别流程
+
+        Returns:
+            识别结果（OCRResults）
+        """
+        return self._recognize(img, box)
+
+    def get_confidence_threshold(self) -> float:
+        """获取当前置信度阈值（修改需重启子进程）"""
+        return self.confidence_threshold
+
+    def close(self):
+        """通知子进程退出并释放共享内存"""
+        if self._process.is_alive():
+            self._requests.put(None)
+            self._process.join(timeout=5)
+            if self._process.is_alive():
+                self._process.terminate()
+        for shm in [self._shm, *self._stale_shm.values()]:
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+        self._shm = None
+        self._stale_shm.clear()
+
+
+__all__ = ['OCRSubprocessClient']
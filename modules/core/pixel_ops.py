@@ -0,0 +1,183 @@
+"""
+像素处理内核模块
+功能：OCR前的像素格式转换、文字框几何计算，安装numba时使用JIT编译的内核，否则回退到OpenCV/NumPy；
+      以及用于近似重复画面检测的感知哈希
+"""
+
+import numpy as np
+import cv2  # type: ignore
+from typing import Optional, Tuple
+
+try:
+    from numba import njit, prange, types  # type: ignore
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    # 显式签名在声明时即完成编译（并写入磁盘缓存），首次按键截图时不再等待JIT；
+    # 输入覆盖连续数组、切片视图等非连续数组，以及各自的只读版本（np.asarray(PIL图像)返回只读数组）
+    _SRC_3D_TYPES = [types.Array(types.uint8, 3, layout, readonly=readonly)
+                     for readonly in (False, True) for layout in ('C', 'A')]
+    _OUT_3D = types.Array(types.uint8, 3, 'C')
+    _OUT_2D = types.Array(types.uint8, 2, 'C')
+
+    @njit([types.void(src, _OUT_3D) for src in _SRC_3D_TYPES],
+          parallel=True, fastmath=True, nogil=True, cache=True)
+    def _rgb_to_bgr_kernel(src, out):
+        """按行并行：一次遍历完成去Alpha通道和RGB->BGR交换"""
+        h, w = out.shape[0], out.shape[1]
+        for y in prange(h):
+            for x in range(w):
+                out[y, x, 0] = src[y, x, 2]
+                out[y, x, 1] = src[y, x, 1]
+                out[y, x, 2] = src[y, x, 0]
+
+    @njit('int32[:, ::1](float32[:, :, ::1], int32, int32)', nogil=True, cache=True)
+    def _polys_to_aabb_kernel(boxes, max_x, max_y):
+        """逐个文字框求四边形顶点的最小/最大坐标；max_x >= 0 时同时限制在 [0, max_x] x [0, max_y] 内"""
+        n = boxes.shape[0]
+        out = np.empty((n, 4), dtype=np.int32)
+        for i in range(n):
+            x1 = x2 = np.int32(boxes[i, 0, 0])
+            y1 = y2 = np.int32(boxes[i, 0, 1])
+            for j in range(1, boxes.shape[1]):
+                x = np.int32(boxes[i, j, 0])
+                y = np.int32(boxes[i, j, 1])
+                x1 = min(x1, x)
+                x2 = max(x2, x)
+                y1 = min(y1, y)
+                y2 = max(y2, y)
+            if max_x >= 0:
+                x1 = min(max(x1, 0), max_x)
+                y1 = min(max(y1, 0), max_y)
+                x2 = min(max(x2, 0), max_x)
+                y2 = min(max(y2, 0), max_y)
+            out[i, 0] = x1
+            out[i, 1] = y1
+            out[i, 2] = x2
+            out[i, 3] = y2
+        return out
+
+    @njit([types.float64(src, _OUT_2D) for src in _SRC_3D_TYPES],
+          parallel=True, fastmath=True, nogil=True, cache=True)
+    def _bgrx_to_gray_kernel(src, out):
+        """按行并行：一次遍历同时写出灰度值并累加亮度总和"""
+        h, w = out.shape[0], out.shape[1]
+        total = 0.0
+        for y in prange(h):
+            row = 0
+            for x in range(w):
+                # 0.114B + 0.587G + 0.299R 的8位定点近似（权重和为256）
+                g = (29 * np.int32(src[y, x, 0]) + 150 * np.int32(src[y, x, 1]) +
+                     77 * np.int32(src[y, x, 2]) + 128) >> 8
+                out[y, x] = g
+                row += g
+            total += row
+        return total
+
+
+def rgb_to_bgr(src: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """将RGB/RGBA像素数组转换为BGR（PaddleOCR按OpenCV约定读取BGR）
+
+    Args:
+        src: (H, W, 3) 或 (H, W, 4) 的uint8数组
+        out: 预分配的 (H, W, 3) uint8输出缓冲区，形状不符时重新分配
+
+    Returns:
+        BGR像素数组（写入out或新分配的缓冲区）
+    """
+    h, w = src.shape[:2]
+    if out is None or out.shape != (h, w, 3):
+        out = np.empty((h, w, 3), dtype=np.uint8)
+
+    if NUMBA_AVAILABLE:
+        _rgb_to_bgr_kernel(src, out)
+    elif src.flags.c_contiguous:
+        # OpenCV的SIMD颜色转换内核，直接写入输出缓冲区
+        code = cv2.COLOR_RGBA2BGR if src.shape[2] == 4 else cv2.COLOR_RGB2BGR
+        cv2.cvtColor(src, code, dst=out)
+    else:
+        # 负步长等非连续视图OpenCV无法直接读取
+        out[...] = src[:, :, 2::-1]
+    return out
+
+
+def bgrx_to_gray(src: np.ndarray, out: Optional[np.ndarray] = None) -> Tuple[np.ndarray, float]:
+    """将BGR/BGRX像素转换为灰度，并在同一遍历中求平均亮度
+
+    Args:
+        src: (H, W, 3) 或 (H, W, 4) 的uint8数组（GDI位图的BGRX内存可直接传入，允许切片视图）
+        out: 预分配的 (H, W) uint8输出缓冲区，形状不符时重新分配
+
+    Returns:
+        (灰度数组, 平均亮度) 的元组
+    """
+    h, w = src.shape[:2]
+    if out is None or out.shape != (h, w):
+        out = np.empty((h, w), dtype=np.uint8)
+    if h == 0 or w == 0:
+        return out, 0.0
+
+    if NUMBA_AVAILABLE:
+        return out, _bgrx_to_gray_kernel(src, out) / (h * w)
+    # OpenCV的灰度转换与求均值均按CPU特性分派到SSE/AVX2内核
+    code = cv2.COLOR_BGRA2GRAY if src.shape[2] == 4 else cv2.COLOR_BGR2GRAY
+    cv2.cvtColor(np.ascontiguousarray(src), code, dst=out)
+    return out, cv2.mean(out)[0]
+
+
+def polys_to_aabb(boxes: np.ndarray, size: Optional[Tuple[int, int]] = None) -> np.ndarray:
+    """将一批文字框四边形转换为轴对齐包围框
+
+    Args:
+        boxes: (N, 4, 2) 顶点坐标数组
+        size: 图像尺寸 (宽, 高)，提供时包围框限制在图像范围内
+
+    Returns:
+        (N, 4) int32数组，每行为 [x1, y1, x2, y2]（坐标先截断为整数）
+    """
+    boxes = np.ascontiguousarray(boxes, dtype=np.float32)
+    max_x, max_y = (size[0] - 1, size[1] - 1) if size is not None else (-1, -1)
+    if NUMBA_AVAILABLE:
+        return _polys_to_aabb_kernel(boxes, max_x, max_y)
+    points = boxes.astype(np.int32)
+    aabbs = np.concatenate([points.min(axis=1), points.max(axis=1)], axis=1)
+    if size is not None:
+        np.clip(aabbs, 0, np.array([max_x, max_y, max_x, max_y], dtype=np.int32), out=aabbs)
+    return aabbs
+
+
+def average_hash(img_array: np.ndarray, size: int = 8) -> int:
+    """计算平均哈希（aHash），画面仅有少量像素偏移时指纹保持不变或仅差几位
+
+    Args:
+        img_array: (H, W, 3/4) RGB(A) 或 (H, W) 灰度uint8数组
+        size: 缩小后的边长，指纹共size*size位，默认8（64位）
+
+    Returns:
+        指纹整数
+    """
+    if img_array.ndim == 3:
+        gray = cv2.cvtColor(np.ascontiguousarray(img_array[:, :, :3]), cv2.COLOR_RGB2GRAY)
+    else:
+        gray = img_array
+    small = cv2.resize(gray, (size, size), interpolation=cv2.INTER_AREA)
+    bits = np.packbits(small > small.mean())  # 行优先
+    return int.from_bytes(bits.tobytes(), 'big')
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """两个指纹之间不同的位数"""
+    return bin(a ^ b).count('1')
+
+
+__all__ = [
+    'NUMBA_AVAILABLE',
+    'rgb_to_bgr',
+    'bgrx_to_gray',
+    'polys_to_aabb',
+    'average_hash',
+    'hamming_distance'
+]
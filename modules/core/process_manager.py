@@ -8,8 +8,136 @@ import win32gui
 import win32process
 import win32con
 import win32api
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Callable, Union
 import time
+import ctypes
+from ctypes import wintypes
+
+TH32CS_SNAPPROCESS = 0x00000002
+INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+
+
+class PROCESSENTRY32W(ctypes.Structure):
+    """Toolhelp32进程快照条目（ctypes按平台自动处理32/64位对齐）"""
+    _fields_ = [
+        ('dwSize', wintypes.DWORD),
+        ('cntUsage', wintypes.DWORD),
+        ('th32ProcessID', wintypes.DWORD),
+        ('th32DefaultHeapID', ctypes.c_size_t),  # ULONG_PTR
+        ('th32ModuleID', wintypes.DWORD),
+        ('cntThreads', wintypes.DWORD),
+        ('th32ParentProcessID', wintypes.DWORD),
+        ('pcPriClassBase', wintypes.LONG),
+        ('dwFlags', wintypes.DWORD),
+        ('szExeFile', wintypes.WCHAR * 260),  # MAX_PATH
+    ]
+
+
+_kernel32 = ctypes.windll.kernel32  # type: ignore
+# 显式声明参数与返回类型，64位进程中快照句柄不会被截断为C int
+_kernel32.CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+_kernel32.CreateToolhelp32Snapshot.argtypes = [wintypes.DWORD, wintypes.DWORD]
+_kernel32.Process32FirstW.restype = wintypes.BOOL
+_kernel32.Process32FirstW.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32W)]
+_kernel32.Process32NextW.restype = wintypes.BOOL
+_kernel32.Process32NextW.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32W)]
+_kernel32.CloseHandle.restype = wintypes.BOOL
+_kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+
+
+def snapshot_process_names() -> Dict[int, str]:
+    """通过一次Toolhelp32快照获取所有进程的 PID -> 进程名 映射
+    
+    Returns:
+        PID到进程名的字典
+        
+    Raises:
+        OSError: 创建快照失败
+    """
+    snapshot = _kernel32.CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
+    if not snapshot or snapshot == INVALID_HANDLE_VALUE:
+        raise OSError("创建进程快照失败")
+    
+    names = {}
+    try:
+        entry = PROCESSENTRY32W()
+        entry.dwSize = ctypes.sizeof(PROCESSENTRY32W)
+        ok = _kernel32.Process32FirstW(snapshot, ctypes.byref(entry))
+        while ok:
+            names[entry.th32ProcessID] = entry.szExeFile
+            ok = _kernel32.Process32NextW(snapshot, ctypes.byref(entry))
+    finally:
+        _kernel32.CloseHandle(snapshot)
+    return names
+
+
+def wait_until(condition: Callable[[], bool], timeout: float, step: float = 0.005) -> bool:
+    """轮询等待条件成立，条件满足时立即返回，最多等待timeout秒
+    
+    Args:
+        condition: 条件函数
+        timeout: 超时时间（秒）
+        step: 轮询间隔（秒）
+        
+    Returns:
+        超时前条件是否成立
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            if condition():
+                return True
+        except Exception:
+            pass  # 窗口状态查询失败时继续等待
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(step)
+
+
+class ProcessResults:
+    """进程搜索结果集合（结构数组布局：PID、进程名、窗口标题、窗口句柄分别存放）
+    
+    按整数下标访问或遍历时返回 {'pid', 'name', 'window_title', 'hwnd'} 字典（兼容原来的进程列表接口，
+    每次访问新建）；切片返回ProcessResults子集。
+    """
+    
+    __slots__ = ('pids', 'names', 'titles', 'hwnds')
+    
+    def __init__(self):
+        self.pids: List[int] = []
+        self.names: List[str] = []
+        self.titles: List[str] = []
+        self.hwnds: List[int] = []
+    
+    def append(self, pid: int, name: str, window_title: str, hwnd: int):
+        """添加一条进程窗口记录"""
+        self.pids.append(pid)
+        self.names.append(name)
+        self.titles.append(window_title)
+        self.hwnds.append(hwnd)
+    
+    def __len__(self) -> int:
+        return len(self.pids)
+    
+    def __getitem__(self, i: Union[int, slice]) -> Union[Dict, 'ProcessResults']:
+        if isinstance(i, slice):
+            subset = ProcessResults()
+            subset.pids = self.pids[i]
+            subset.names = self.names[i]
+            subset.titles = self.titles[i]
+            subset.hwnds = self.hwnds[i]
+            return subset
+        return {
+            'pid': self.pids[i],
+            'name': self.names[i],
+            'window_title': self.titles[i],
+            'hwnd': self.hwnds[i]
+        }
+    
+    def __iter__(self):
+        for pid, name, title, hwnd in zip(self.pids, self.names, self.titles, self.hwnds):
+            yield {'pid': pid, 'name': name, 'window_title': title, 'hwnd': hwnd}
+
 
 class ProcessManager:
     """进程管理类"""
@@ -29,56 +157,61 @@ class ProcessManager:
         else:
             print(f"[{level}] {message}")
     
-    def find_processes_by_name(self, keyword: str) -> List[Dict]:
+    def find_processes_by_name(self, keyword: str) -> ProcessResults:
         """查找包含关键字的进程
         
         Args:
             keyword: 进程名关键字
             
         Returns:
-            匹配的进程信息列表
+            匹配的进程信息（ProcessResults）
         """
-        found_processes = []
+        found_processes = ProcessResults()
         keyword_lower = keyword.lower()
         
-        # 获取所有窗口句柄
+        # 获取所有窗口句柄及标题（枚举时已读取标题，无需再次调用GetWindowText）
         windows = []
         
         def enum_windows_callback(hwnd, windows):
-            if win32gui.IsWindowVisible(hwnd) and win32gui.GetWindowText(hwnd):
-                windows.append(hwnd)
+            if win32gui.IsWindowVisible(hwnd):
+                window_title = win32gui.GetWindowText(hwnd)
+                if window_title:
+                    windows.append((hwnd, window_title))
             return True
         
+        # 本次搜索的 PID -> 进程名 映射：一次进程快照取得全部进程名，无需逐个打开进程
+        try:
+            pid_to_name: Dict[int, Optional[str]] = snapshot_process_names()
+        except Exception as e:
+            self.log_message(f"进程快照失败，逐个查询进程名: {e}", "WARNING")
+            pid_to_name = {}
+        
         try:
             win32gui.EnumWindows(enum_windows_callback, windows)
             
-            for hwnd in windows:
+            for hwnd, window_title in windows:
                 try:
-                    # 获取窗口标题
-                    window_title = win32gui.GetWindowText(hwnd)
-                    if not window_title:
-                        continue
-                    
                     # 获取进程ID和进程信息
                     _, pid = win32process.GetWindowThreadProcessId(hwnd)
                     
-                    try:
-                        process = psutil.Process(pid)
-                        process_name = process.name()
-                        
-                        # 检查进程名或窗口标题是否包含关键字
-                        if (keyword_lower in process_name.lower() or 
-                            keyword_lower in window_title.lower()):
-                            
-                            found_processes.append({
-                                'pid': pid,
-                                'name': process_name,
-                                'window_title': window_title,
-                                'hwnd': hwnd
-                            })
-                            
-                    except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    if pid in pid_to_name:
+                        process_name = pid_to_name[pid]
+                    else:
+                        # 快照之后新建的进程（或快照失败时）回退到psutil查询
+                        try:
+                            process_name = psutil.Process(pid).name()
+                        except (psutil.NoSuchProcess, psutil.AccessDenied):
+                            process_name = None
+                        pid_to_name[pid] = process_name
+                    
+                    if process_name is None:
                         continue
+                    
+                    # 检查进程名或窗口标题是否包含关键字
+                    if (keyword_lower in process_name.lower() or 
+                        keyword_lower in window_title.lower()):
+                        
+                        found_processes.append(pid, process_name, window_title, hwnd)
                         
                 except Exception:
                     continue
@@ -108,8 +241,8 @@ class ProcessManager:
             # 设置为前台窗口
             win32gui.SetForegroundWindow(hwnd)
             
-            # 等待窗口激活
-            time.sleep(0.5)
+            # 等待窗口激活（成为前台窗口即返回）
+            wait_until(lambda: win32gui.GetForegroundWindow() == hwnd, 0.5)
             
             self.log_message("基本窗口激活完成")
             return True
@@ -153,8 +286,8 @@ class ProcessManager:
             if current_thread_id != target_thread_id:
                 win32process.AttachThreadInput(current_thread_id, target_thread_id, False)
             
-            # 等待窗口激活
-            time.sleep(1)
+            # 等待窗口激活（成为前台窗口且已恢复即返回）
+            wait_until(lambda: win32gui.GetForegroundWindow() == hwnd and not win32gui.IsIconic(hwnd), 1.0)
             
             self.log_message("强制窗口激活完成")
             return True
@@ -4,12 +4,69 @@
 """
 
 import win32gui
-import win32ui
 import win32con
-from PIL import Image, ImageGrab
+from PIL import Image, ImageGrab, ImageStat
 import numpy as np
 import time
+import ctypes
+import threading
+from ctypes import wintypes
 from typing import Optional, Dict, Any
+from .pixel_ops import bgrx_to_gray
+from .ddupl_engine import DesktopDuplicator
+from .process_manager import wait_until
+
+# PrintWindow标志：要求窗口完整渲染内容（Windows 8.1+，可截取DirectComposition/硬件加速窗口）
+PW_RENDERFULLCONTENT = 0x2
+# 黑色图像检测：平均亮度阈值与采样缩略图边长
+BLACK_THRESHOLD = 10
+BLACK_SAMPLE_SIZE = 64
+# 窗口矩形缓存有效期（秒）：连续截图时不必每帧查询，窗口移动/缩放后最多延迟该时间生效
+RECT_CACHE_TTL = 0.5
+
+BI_RGB = 0
+DIB_RGB_COLORS = 0
+
+
+class BITMAPINFOHEADER(ctypes.Structure):
+    """GDI位图信息头（创建32位自顶向下DIB时使用）"""
+    _fields_ = [
+        ('biSize', wintypes.DWORD),
+        ('biWidth', wintypes.LONG),
+        ('biHeight', wintypes.LONG),
+        ('biPlanes', wintypes.WORD),
+        ('biBitCount', wintypes.WORD),
+        ('biCompression', wintypes.DWORD),
+        ('biSizeImage', wintypes.DWORD),
+        ('biXPelsPerMeter', wintypes.LONG),
+        ('biYPelsPerMeter', wintypes.LONG),
+        ('biClrUsed', wintypes.DWORD),
+        ('biClrImportant', wintypes.DWORD),
+    ]
+
+
+def _bitmap_info(width: int, height: int) -> BITMAPINFOHEADER:
+    """构造32位BGRX、自顶向下（biHeight为负）的位图信息头"""
+    bmi = BITMAPINFOHEADER()
+    bmi.biSize = ctypes.sizeof(BITMAPINFOHEADER)
+    bmi.biWidth = width
+    bmi.biHeight = -height
+    bmi.biPlanes = 1
+    bmi.biBitCount = 32
+    bmi.biCompression = BI_RGB
+    return bmi
+
+
+_gdi32 = ctypes.windll.gdi32
+# 显式声明句柄类型，64位进程中返回的HBITMAP不会被截断为int
+_gdi32.CreateDIBSection.restype = wintypes.HBITMAP
+_gdi32.CreateDIBSection.argtypes = [wintypes.HDC, ctypes.c_void_p, wintypes.UINT,
+                                    ctypes.POINTER(ctypes.c_void_p), wintypes.HANDLE, wintypes.DWORD]
+
+_user32 = ctypes.windll.user32
+_user32.PrintWindow.restype = wintypes.BOOL
+_user32.PrintWindow.argtypes = [wintypes.HWND, wintypes.HDC, wintypes.UINT]
+
 
 class ScreenshotEngine:
     """截图引擎类"""
@@ -21,6 +78,29 @@ class ScreenshotEngine:
             logger: 日志记录器实例
         """
         self.logger = logger
+        # 每个窗口缓存的GDI资源 (窗口DC, 内存DC, DIB位图, 原位图, 像素指针, 宽, 高)，
+        # 窗口尺寸不变时连续截图只执行BitBlt/PrintWindow；窗口DC属于公共DC缓存，每帧获取后立即释放
+        self._gdi_cache: Dict[int, tuple] = {}
+        self._gdi_lock = threading.Lock()  # 自动截图线程与界面线程共用缓存
+        # 窗口矩形缓存 {hwnd: (rect, 查询时的单调时钟时间)}
+        self._rect_cache: Dict[int, tuple] = {}
+        # 黑色画面完整统计时复用的灰度缓冲区（仅在持有_gdi_lock时使用）
+        self._gray_buf: Optional[np.ndarray] = None
+        # 桌面复制截图器（DXCam实例在首次截图时创建，之后复用）
+        self._duplicator = DesktopDuplicator(logger)
+        
+        # 截图方法分派表：capture_window按方法名直接查表，参数统一为 (hwnd, rect, process_manager)
+        self._dispatch = {
+            "standard": lambda hwnd, rect, pm: self.capture_window_standard(rect),
+            "handle": lambda hwnd, rect, pm: self.capture_window_by_handle(hwnd),
+            "auto": self.capture_window_auto,
+            # 纯后台截图，不激活窗口
+            "background": lambda hwnd, rect, pm: self.capture_window_background(hwnd),
+            # 智能截图，后台优先带回退
+            "smart": lambda hwnd, rect, pm: self.capture_window_with_fallback(hwnd, True, pm),
+            # 桌面复制截图，不激活窗口，被遮挡时回退到后台截图
+            "desktop_duplication": lambda hwnd, rect, pm: self.capture_window_desktop(hwnd, rect),
+        }
     
     def log_message(self, message: str, level: str = "INFO"):
         """记录日志消息"""
@@ -57,71 +137,255 @@ class ScreenshotEngine:
             截图图像或None
         """
         try:
-            # 获取窗口设备上下文
-            hwndDC = win32gui.GetWindowDC(hwnd)
-            mfcDC = win32ui.CreateDCFromHandle(hwndDC)
-            saveDC = mfcDC.CreateCompatibleDC()
+            im = self._capture_window_dc(hwnd, use_print_window=False)
+            if im is not None:
+                self.log_message(f"窗口句柄截图完成，尺寸: {im.width}x{im.height}")
+            return im
+        except Exception as e:
+            self.log_message(f"窗口句柄截图失败: {e}", "ERROR")
+            return None
+    
+    def capture_window_printwindow(self, hwnd) -> Optional[Image.Image]:
+        """通过PrintWindow截图（无需激活窗口，被遮挡的窗口也能截取）
+        
+        Args:
+            hwnd: 窗口句柄
+            
+        Returns:
+            截图图像或None（失败或得到黑色图像时）
+        """
+        try:
+            # 黑色画面在解包为PIL图像前即被拒绝
+            im = self._capture_window_dc(hwnd, use_print_window=True, black_threshold=BLACK_THRESHOLD)
+            if im is None:
+                return None
+            self.log_message(f"PrintWindow截图完成，尺寸: {im.width}x{im.height}")
+            return im
+        except Exception as e:
+            self.log_message(f"PrintWindow截图失败: {e}", "ERROR")
+            return None
+    
+    def _ensure_gdi_resources(self, hwnd, width: int, height: int) -> Optional[tuple]:
+        """获取窗口缓存的GDI资源，首次截图或窗口尺寸变化时重新创建
+        
+        Args:
+            hwnd: 窗口句柄
+            width: 窗口宽度
+            height: 窗口高度
             
-            # 获取窗口大小
-            left, top, right, bottom = win32gui.GetWindowRect(hwnd)
-            width = right - left
-            height = bottom - top
+        Returns:
+            (内存DC, DIB位图, 原位图, 像素指针, 宽, 高) 或None（创建DIB失败时）
+        """
+        cached = self._gdi_cache.get(hwnd)
+        if cached is not None and cached[4:] == (width, height):
+            return cached
+        self._release_gdi_resources(hwnd)
+        
+        # 窗口DC只用于创建兼容的内存DC与DIB位图，创建完成后立即释放
+        hwndDC = win32gui.GetWindowDC(hwnd)
+        try:
+            memDC = win32gui.CreateCompatibleDC(hwndDC)
             
-            # 创建位图
-            saveBitMap = win32ui.CreateBitmap()
-            saveBitMap.CreateCompatibleBitmap(mfcDC, width, height)
-            saveDC.SelectObject(saveBitMap)
+            # 创建32位自顶向下DIB位图，bits指向其像素内存；位图常驻内存DC直到释放
+            bits = ctypes.c_void_p()
+            bmi = _bitmap_info(width, height)
+            hbitmap = _gdi32.CreateDIBSection(hwndDC, ctypes.byref(bmi), DIB_RGB_COLORS,
+                                              ctypes.byref(bits), None, 0)
+        finally:
+            win32gui.ReleaseDC(hwnd, hwndDC)
+        if not hbitmap or not bits.value:
+            if hbitmap:
+                win32gui.DeleteObject(hbitmap)
+            win32gui.DeleteDC(memDC)
+            return None
+        old_bitmap = win32gui.SelectObject(memDC, hbitmap)
+        
+        cached = (memDC, hbitmap, old_bitmap, bits.value, width, height)
+        self._gdi_cache[hwnd] = cached
+        return cached
+    
+    def _release_gdi_resources(self, hwnd):
+        """释放窗口缓存的GDI资源"""
+        cached = self._gdi_cache.pop(hwnd, None)
+        if cached is None:
+            return
+        memDC, hbitmap, old_bitmap = cached[:3]
+        try:
+            win32gui.SelectObject(memDC, old_bitmap)
+            win32gui.DeleteObject(hbitmap)
+            win32gui.DeleteDC(memDC)
+        except Exception as e:
+            self.log_message(f"释放GDI资源失败: {e}", "WARNING")
+    
+    def _cached_rect(self, hwnd, ttl: float = RECT_CACHE_TTL) -> tuple:
+        """获取窗口矩形，有效期内直接返回缓存值（查询失败时抛出异常）
+        
+        Args:
+            hwnd: 窗口句柄
+            ttl: 缓存有效期（秒）
             
-            # 复制窗口内容到位图
-            result = saveDC.BitBlt((0, 0), (width, height), mfcDC, (0, 0), win32con.SRCCOPY)
+        Returns:
+            窗口矩形 (left, top, right, bottom)
+        """
+        now = time.monotonic()
+        cached = self._rect_cache.get(hwnd)
+        if cached is not None and now - cached[1] < ttl:
+            return cached[0]
+        rect = tuple(win32gui.GetWindowRect(hwnd))
+        self._rect_cache[hwnd] = (rect, now)
+        return rect
+    
+    def invalidate_rect_cache(self, hwnd=None):
+        """清除窗口矩形缓存
+        
+        Args:
+            hwnd: 窗口句柄，为None时清除所有窗口
+        """
+        if hwnd is None:
+            self._rect_cache.clear()
+        else:
+            self._rect_cache.pop(hwnd, None)
+    
+    def prepare_for_session(self, hwnd) -> bool:
+        """按窗口当前尺寸预先创建连续截图所需的资源（自动截图开始时调用）
+        
+        创建该窗口的GDI位图缓存与黑色检测灰度缓冲区，第一帧截图不再承担分配开销；
+        窗口尺寸变化时由截图路径自动重建。
+        
+        Args:
+            hwnd: 窗口句柄
             
-            if result:
-                # 获取位图数据
-                bmpinfo = saveBitMap.GetInfo()
-                bmpstr = saveBitMap.GetBitmapBits(True)
-                
-                # 创建PIL图像
-                im = Image.frombuffer(
-                    'RGB',
-                    (bmpinfo['bmWidth'], bmpinfo['bmHeight']),
-                    bmpstr, 'raw', 'BGRX', 0, 1
-                )
-                
-                # 清理资源
-                win32gui.DeleteObject(saveBitMap.GetHandle())
-                saveDC.DeleteDC()
-                mfcDC.DeleteDC()
-                win32gui.ReleaseDC(hwnd, hwndDC)
-                
-                self.log_message(f"窗口句柄截图完成，尺寸: {width}x{height}")
-                return im
-            else:
-                # 清理资源
-                win32gui.DeleteObject(saveBitMap.GetHandle())
-                saveDC.DeleteDC()
-                mfcDC.DeleteDC()
-                win32gui.ReleaseDC(hwnd, hwndDC)
-                return None
-                
+        Returns:
+            是否准备成功
+        """
+        try:
+            # 新的截图会话重新查询窗口矩形
+            self.invalidate_rect_cache(hwnd)
+            left, top, right, bottom = self._cached_rect(hwnd)
+            width, height = right - left, bottom - top
+            if width <= 0 or height <= 0:
+                return False
+            with self._gdi_lock:
+                if self._ensure_gdi_resources(hwnd, width, height) is None:
+                    return False
+                if self._gray_buf is None or self._gray_buf.shape != (height, width):
+                    self._gray_buf = np.empty((height, width), dtype=np.uint8)
+            return True
         except Exception as e:
-            self.log_message(f"窗口句柄截图失败: {e}", "ERROR")
-            return None
+            self.log_message(f"准备截图资源失败: {e}", "WARNING")
+            return False
+    
+    def close(self):
+        """释放所有缓存的GDI资源与桌面复制实例（程序退出时调用）"""
+        with self._gdi_lock:
+            for hwnd in list(self._gdi_cache):
+                self._release_gdi_resources(hwnd)
+        self._duplicator.close()
+    
+    def _capture_window_dc(self, hwnd, use_print_window: bool,
+                           black_threshold: Optional[float] = None) -> Optional[Image.Image]:
+        """将窗口内容复制到缓存的DIB位图并转换为PIL图像
+        
+        BitBlt/PrintWindow直接写入DIB位图的像素内存，PIL从该内存解包，
+        不再经过GetBitmapBits的设备位图转换和整帧bytes复制。
+        
+        Args:
+            hwnd: 窗口句柄
+            use_print_window: True时由窗口自身通过PrintWindow绘制，False时从窗口DC执行BitBlt
+            black_threshold: 设置时直接在位图内存上检测黑色画面，平均亮度低于该值返回None
+            
+        Returns:
+            截图图像或None
+        """
+        # 获取窗口大小
+        left, top, right, bottom = self._cached_rect(hwnd)
+        width = right - left
+        height = bottom - top
+        
+        with self._gdi_lock:
+            resources = self._ensure_gdi_resources(hwnd, width, height)
+            if resources is None:
+                return None
+            memDC, _, _, bits = resources[:4]
+            
+            # 复制窗口内容到位图（BitBlt失败时抛出异常）
+            try:
+                if use_print_window:
+                    if not _user32.PrintWindow(hwnd, memDC, PW_RENDERFULLCONTENT):
+                        return None
+                else:
+                    hwndDC = win32gui.GetWindowDC(hwnd)
+                    try:
+                        win32gui.BitBlt(memDC, 0, 0, width, height, hwndDC, 0, 0, win32con.SRCCOPY)
+                    finally:
+                        win32gui.ReleaseDC(hwnd, hwndDC)
+                # 确保批量的GDI绘制已写入像素内存
+                _gdi32.GdiFlush()
+            except Exception:
+                # 窗口可能已重建，下次截图重新创建位图
+                self._release_gdi_resources(hwnd)
+                raise
+            
+            pixels = (ctypes.c_ubyte * (width * height * 4)).from_address(bits)
+            if black_threshold is not None and self._is_black_bgrx(
+                    np.frombuffer(pixels, dtype=np.uint8).reshape(height, width, 4), black_threshold):
+                return None
+            # 创建PIL图像（解包到PIL自有内存，位图留给下一帧复用）
+            return Image.frombuffer('RGB', (width, height), pixels, 'raw', 'BGRX', 0, 1)
+    
+    def _is_black_bgrx(self, pixels: np.ndarray, threshold: float) -> bool:
+        """在BGRX位图内存上检测黑色画面（先采样估计，接近阈值时再完整统计）
+        
+        Args:
+            pixels: (H, W, 4) BGRX像素视图
+            threshold: 亮度阈值
+            
+        Returns:
+            是否为黑色图像
+        """
+        h, w = pixels.shape[:2]
+        sample = pixels[::max(1, h // BLACK_SAMPLE_SIZE), ::max(1, w // BLACK_SAMPLE_SIZE)]
+        _, avg_brightness = bgrx_to_gray(sample)
+        if threshold / 2 <= avg_brightness < threshold * 2:
+            # 灰度转换与亮度求和在同一遍历中完成，灰度写入复用的缓冲区
+            self._gray_buf, avg_brightness = bgrx_to_gray(pixels, self._gray_buf)
+        
+        if avg_brightness < threshold:
+            self.log_message(f"检测到黑色图像，平均亮度: {avg_brightness:.1f}")
+            return True
+        return False
+    
+    @staticmethod
+    def _mean_brightness(image: Image.Image) -> float:
+        """所有通道的平均亮度（由PIL的C直方图统计计算，不分配像素数组）"""
+        channel_means = ImageStat.Stat(image).mean
+        return sum(channel_means) / len(channel_means)
     
-    def is_black_image(self, image: Image.Image, threshold: int = 10) -> bool:
+    def is_black_image(self, image: Image.Image, threshold: int = BLACK_THRESHOLD,
+                       roi: Optional[tuple] = None) -> bool:
         """检查图像是否为黑色或接近黑色
         
+        先在最近邻采样的缩略图上估计亮度，仅在估计值接近阈值时才统计完整图像。
+        
         Args:
             image: PIL图像
             threshold: 亮度阈值
+            roi: 只检查的区域 (left, top, right, bottom)，可用于跳过已知的空白边框
             
         Returns:
             是否为黑色图像
         """
         try:
-            # 转换为numpy数组
-            img_array = np.array(image)
-            # 计算平均亮度
-            avg_brightness = np.mean(img_array)
+            box = roi or (0, 0, image.width, image.height)
+            # 最近邻缩放只读取采样点像素，与原图分辨率无关
+            thumb = image.resize((BLACK_SAMPLE_SIZE, BLACK_SAMPLE_SIZE), Image.NEAREST, box=box)
+            avg_brightness = self._mean_brightness(thumb)
+            
+            # 估计值落在阈值附近时以完整区域的统计结果为准
+            if threshold / 2 <= avg_brightness < threshold * 2:
+                full = image if roi is None else image.crop(roi)
+                avg_brightness = self._mean_brightness(full)
+            
             # 如果平均亮度低于阈值，认为是黑色图像
             is_black = avg_brightness < threshold
             
@@ -133,6 +397,26 @@ class ScreenshotEngine:
             self.log_message(f"黑色图像检测失败: {e}", "ERROR")
             return False
     
+    def capture_window_desktop(self, hwnd, rect: tuple) -> Optional[Image.Image]:
+        """桌面复制截图（从DXGI桌面画面中裁剪窗口区域，窗口被遮挡时回退到后台截图）
+        
+        Args:
+            hwnd: 窗口句柄
+            rect: 窗口矩形 (left, top, right, bottom)
+            
+        Returns:
+            截图图像或None
+        """
+        if self._duplicator.available and self._duplicator.is_window_unobscured(hwnd, rect):
+            frame = self._duplicator.grab(rect)
+            if frame is not None:
+                left, top, right, bottom = rect
+                self.log_message(f"桌面复制截图完成，尺寸: {right-left}x{bottom-top}")
+                return Image.fromarray(frame)
+        
+        self.log_message("桌面复制截图不可用或窗口被遮挡，回退到后台截图")
+        return self.capture_window_background(hwnd)
+    
     def capture_window_background(self, hwnd) -> Optional[Image.Image]:
         """后台截图方法（不激活窗口）
         
@@ -148,9 +432,15 @@ class ScreenshotEngine:
                 self.log_message("目标窗口已最小化，后台截图可能失败")
                 # 尝试后台恢复窗口（不激活）
                 win32gui.ShowWindow(hwnd, win32con.SW_SHOWNOACTIVATE)
-                time.sleep(0.5)  # 等待窗口恢复
+                wait_until(lambda: not win32gui.IsIconic(hwnd), 0.5)  # 等待窗口恢复
+                self.invalidate_rect_cache(hwnd)  # 最小化时的矩形已失效
+            
+            # 优先使用PrintWindow（硬件加速窗口也能截取），失败时从窗口DC直接截图（不改变窗口状态）
+            screenshot = self.capture_window_printwindow(hwnd)
+            if screenshot:
+                self.log_message("后台截图成功")
+                return screenshot
             
-            # 使用窗口句柄直接截图（不改变窗口状态）
             screenshot = self.capture_window_by_handle(hwnd)
             
             if screenshot and not self.is_black_image(screenshot):
@@ -195,14 +485,16 @@ class ScreenshotEngine:
             if rect:
                 # 先尝试基本激活
                 if process_manager.activate_window(hwnd):
-                    time.sleep(0.5)
+                    # 窗口成为前台窗口后立即截图，不再固定等待
+                    wait_until(lambda: win32gui.GetForegroundWindow() == hwnd, 0.5)
                     screenshot = self.capture_window_standard(rect)
                     
                     # 如果还是黑色，尝试强制激活
                     if not screenshot or self.is_black_image(screenshot):
                         self.log_message("基本激活截图失败，尝试强制激活")
                         if process_manager.force_activate_window(hwnd):
-                            time.sleep(1)
+                            wait_until(lambda: win32gui.GetForegroundWindow() == hwnd
+                                       and not win32gui.IsIconic(hwnd), 1.0)
                             screenshot = self.capture_window_standard(rect)
         
         if screenshot:
@@ -230,21 +522,23 @@ class ScreenshotEngine:
         
         Args:
             hwnd: 窗口句柄
-            method: 截图方法 ("standard", "handle", "auto", "background", "smart")
+            method: 截图方法 ("standard", "handle", "auto", "background", "smart", "desktop_duplication")
             process_manager: 进程管理器实例
             
         Returns:
             截图图像或None
         """
-        # 获取窗口位置和大小
-        if process_manager:
-            rect = process_manager.get_window_rect(hwnd)
-        else:
-            try:
-                rect = win32gui.GetWindowRect(hwnd)
-            except Exception as e:
-                self.log_message(f"获取窗口矩形失败: {e}", "ERROR")
-                return None
+        capture = self._dispatch.get(method)
+        if capture is None:
+            self.log_message(f"未知的截图方法: {method}", "ERROR")
+            return None
+        
+        # 获取窗口位置和大小（连续截图时使用缓存的矩形）
+        try:
+            rect = self._cached_rect(hwnd)
+        except Exception as e:
+            self.log_message(f"获取窗口矩形失败: {e}", "ERROR")
+            return None
         
         if not rect:
             self.log_message("无法获取窗口位置信息", "ERROR")
@@ -259,21 +553,7 @@ class ScreenshotEngine:
         
         self.log_message(f"开始截图，方法: {method}，区域: {right-left}x{bottom-top}")
         
-        if method == "standard":
-            return self.capture_window_standard(rect)
-        elif method == "handle":
-            return self.capture_window_by_handle(hwnd)
-        elif method == "auto":
-            return self.capture_window_auto(hwnd, rect, process_manager)
-        elif method == "background":
-            # 纯后台截图，不激活窗口
-            return self.capture_window_background(hwnd)
-        elif method == "smart":
-            # 智能截图，后台优先带回退
-            return self.capture_window_with_fallback(hwnd, background_first=True, process_manager=process_manager)
-        else:
-            self.log_message(f"未知的截图方法: {method}", "ERROR")
-            return None
+        return capture(hwnd, rect, process_manager)
     
     def get_timing_info(self) -> Dict[str, Any]:
         """获取时间统计信息
@@ -7,8 +7,14 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from datetime import datetime
 import threading
+from collections import deque
 from typing import List, Dict, Optional, Callable
 
+# 日志区域批量刷新间隔（毫秒）
+LOG_FLUSH_INTERVAL = 100
+# 日志区域最多保留的行数，超出时删除最早的日志
+LOG_MAX_LINES = 5000
+
 
 class ProcessCaptureUI:
     """进程窗口截图工具的GUI界面类"""
@@ -27,11 +33,13 @@ class ProcessCaptureUI:
         self.capture_interval_var = tk.IntVar(value=5)
         self.capture_method_var = tk.StringVar(value="standard")  # 默认标准截图
         self.timing_enabled = tk.BooleanVar(value=True)  # 默认启用时间记录
+        self.fixed_region_var = tk.BooleanVar(value=False)  # 固定识别区域（跳过文字检测）
+        self.ocr_detail_var = tk.BooleanVar(value=True)  # 日志中显示逐条识别文本
+        self.region_var = tk.StringVar()  # 识别区域 "x1,y1,x2,y2"
         self.status_var = tk.StringVar(value="就绪")
         
         # 控制变量
         self.is_capturing = False
-        self.capture_thread = None
         
         # 回调函数
         self.search_callback = None
@@ -39,6 +47,7 @@ class ProcessCaptureUI:
         self.start_auto_callback = None
         self.stop_auto_callback = None
         self.browse_path_callback = None
+        self.ocr_detail_callback = None
         
         # UI组件 - 这些组件在setup_ui中初始化
         self.process_listbox: Optional[tk.Listbox] = None
@@ -47,6 +56,11 @@ class ProcessCaptureUI:
         self.start_btn: Optional[ttk.Button] = None
         self.stop_btn: Optional[ttk.Button] = None
         
+        # 待显示的日志：任意线程只追加到队列，由UI线程定时批量写入日志区域
+        self._log_queue = deque()
+        self._log_lock = threading.Lock()
+        self._log_history = deque(maxlen=LOG_MAX_LINES)  # 已显示的日志（导出时使用，仅UI线程访问）
+        
         # 初始化UI
         self.setup_ui()
         
@@ -55,13 +69,15 @@ class ProcessCaptureUI:
         
         # 初始化日志
         self.log_message("程序启动完成，请输入进程名关键字开始使用")
+        self.root.after(LOG_FLUSH_INTERVAL, self._drain_log)
     
     def set_callbacks(self, 
                      search_callback: Callable[[str], List[Dict]],
                      capture_single_callback: Callable[[], bool],
                      start_auto_callback: Callable[[], bool],
                      stop_auto_callback: Callable[[], None],
-                     browse_path_callback: Optional[Callable[[], str]] = None):
+                     browse_path_callback: Optional[Callable[[], str]] = None,
+                     ocr_detail_callback: Optional[Callable[[bool], None]] = None):
         """设置回调函数
         
         Args:
@@ -70,12 +86,14 @@ class ProcessCaptureUI:
             start_auto_callback: 开始自动截图的回调函数
             stop_auto_callback: 停止自动截图的回调函数
             browse_path_callback: 浏览路径的回调函数
+            ocr_detail_callback: 切换"显示识别文本"时的回调函数，接收是否启用
         """
         self.search_callback = search_callback
         self.capture_single_callback = capture_single_callback
         self.start_auto_callback = start_auto_callback
         self.stop_auto_callback = stop_auto_callback
         self.browse_path_callback = browse_path_callback
+        self.ocr_detail_callback = ocr_detail_callback
     
     def setup_ui(self):
         """设置UI界面"""
@@ -132,7 +150,8 @@ class ProcessCaptureUI:
         # 第一行：基本截图方法
         ttk.Radiobutton(method_frame, text="标准截图（默认）", variable=self.capture_method_var, value="standard").grid(row=0, column=0, sticky=tk.W, padx=(0, 15))
         ttk.Radiobutton(method_frame, text="窗口句柄", variable=self.capture_method_var, value="handle").grid(row=0, column=1, sticky=tk.W, padx=(0, 15))
-        ttk.Radiobutton(method_frame, text="自动选择", variable=self.capture_method_var, value="auto").grid(row=0, column=2, sticky=tk.W)
+        ttk.Radiobutton(method_frame, text="自动选择", variable=self.capture_method_var, value="auto").grid(row=0, column=2, sticky=tk.W, padx=(0, 15))
+        ttk.Radiobutton(method_frame, text="桌面复制", variable=self.capture_method_var, value="desktop_duplication").grid(row=0, column=3, sticky=tk.W)
         
         # 第二行：智能截图方法
         ttk.Radiobutton(method_frame, text="后台截图", variable=self.capture_method_var, value="background").grid(row=1, column=0, sticky=tk.W, padx=(0, 15), pady=(5, 0))
@@ -147,6 +166,18 @@ class ProcessCaptureUI:
                             foreground="gray", wraplength=650)
         tip_label.grid(row=1, column=0, columnspan=4, sticky=tk.W, pady=(5, 0))
         
+        # 第三行：固定识别区域
+        region_check = ttk.Checkbutton(method_frame, text="固定识别区域", variable=self.fixed_region_var)
+        region_check.grid(row=2, column=0, sticky=tk.W, pady=(5, 0))
+        ttk.Label(method_frame, text="区域(x1,y1,x2,y2):").grid(row=2, column=1, sticky=tk.W, pady=(5, 0))
+        region_entry = ttk.Entry(method_frame, textvariable=self.region_var, width=20)
+        region_entry.grid(row=2, column=2, sticky=tk.W, pady=(5, 0))
+        
+        # 识别文本日志选项（关闭时日志只显示识别数量）
+        detail_check = ttk.Checkbutton(method_frame, text="显示识别文本", variable=self.ocr_detail_var,
+                                       command=self.on_ocr_detail_toggled)
+        detail_check.grid(row=2, column=3, sticky=tk.W, padx=(20, 0), pady=(5, 0))
+        
         # 保存路径设置
         path_frame = ttk.LabelFrame(main_frame, text="保存设置", padding="10")
         path_frame.grid(row=5, column=0, columnspan=3, sticky=tk.W+tk.E, pady=(15, 10))  # type: ignore
@@ -218,30 +249,41 @@ class ProcessCaptureUI:
         status_label.grid(row=8, column=0, columnspan=3, sticky=tk.W+tk.E, pady=(15, 0))  # type: ignore
     
     def log_message(self, message: str, level: str = "INFO"):
-        """在日志区域显示消息"""
+        """在日志区域显示消息（可在任意线程调用，日志由UI线程定时批量写入）"""
         try:
             timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]  # 包含毫秒
-            log_entry = f"[{timestamp}] [{level}] {message}\n"
-            
-            # 在UI线程中更新日志
-            def update_log():
-                if self.log_text:
-                    self.log_text.config(state=tk.NORMAL)
-                    self.log_text.insert(tk.END, log_entry)
-                    self.log_text.see(tk.END)  # 自动滚动到最后
-                    self.log_text.config(state=tk.DISABLED)
+            with self._log_lock:
+                self._log_queue.append(f"[{timestamp}] [{level}] {message}\n")
+        except Exception as e:
+            print(f"日志输出错误: {e}")
+    
+    def _drain_log(self):
+        """将队列中积累的日志一次性写入日志区域，并安排下一次刷新"""
+        try:
+            with self._log_lock:
+                entries = list(self._log_queue)
+                self._log_queue.clear()
             
-            # 如果在主线程中，直接更新；否则使用after方法
-            if threading.current_thread() == threading.main_thread():
-                update_log()
-            else:
-                self.root.after(0, update_log)
-                
+            if entries and self.log_text:
+                self._log_history.extend(entries)
+                self.log_text.config(state=tk.NORMAL)
+                self.log_text.insert(tk.END, "".join(entries))
+                # 限制日志行数，长时间自动截图时插入与滚动的开销保持不变
+                lines = int(self.log_text.index('end-1c').split('.')[0])
+                if lines > LOG_MAX_LINES:
+                    self.log_text.delete('1.0', f'{lines - LOG_MAX_LINES}.0')
+                self.log_text.see(tk.END)  # 自动滚动到最后
+                self.log_text.config(state=tk.DISABLED)
         except Exception as e:
             print(f"日志输出错误: {e}")
+        finally:
+            self.root.after(LOG_FLUSH_INTERVAL, self._drain_log)
     
     def clear_log(self):
         """清空日志"""
+        with self._log_lock:
+            self._log_queue.clear()
+        self._log_history.clear()
         if self.log_text:
             self.log_text.config(state=tk.NORMAL)
             self.log_text.delete(1.0, tk.END)
@@ -257,10 +299,10 @@ class ProcessCaptureUI:
                 filetypes=[("Text files", "*.txt"), ("All files", "*.*")]
             )
             
-            if filename and self.log_text:
-                log_content = self.log_text.get(1.0, tk.END)
+            if filename:
+                # 直接写出日志记录，不经过Tcl读取整个文本控件的内容
                 with open(filename, 'w', encoding='utf-8') as f:
-                    f.write(log_content)
+                    f.writelines(self._log_history)
                 self.log_message(f"日志已导出到: {filename}")
                 messagebox.showinfo("成功", f"日志已导出到:\n{filename}")
         except Exception as e:
@@ -283,9 +325,10 @@ class ProcessCaptureUI:
                 found_processes = self.search_callback(keyword)
                 
                 if found_processes and self.process_listbox:
-                    for proc_info in found_processes:
-                        display_text = f"PID: {proc_info['pid']} | {proc_info['name']} | 窗口: {proc_info['window_title']}"
-                        self.process_listbox.insert(tk.END, display_text)
+                    rows = [f"PID: {proc_info['pid']} | {proc_info['name']} | 窗口: {proc_info['window_title']}"
+                            for proc_info in found_processes]
+                    # 一次调用插入所有行，避免逐行往返Tcl和重新布局
+                    self.process_listbox.insert(tk.END, *rows)
                     
                     # 默认选中第一个进程
                     if len(found_processes) > 0:
@@ -414,10 +457,37 @@ class ProcessCaptureUI:
         """获取截图方法"""
         return self.capture_method_var.get()
     
+    def is_fixed_region_enabled(self) -> bool:
+        """是否启用固定识别区域"""
+        return self.fixed_region_var.get()
+    
+    def get_fixed_region(self) -> Optional[tuple]:
+        """获取输入的固定识别区域
+        
+        Returns:
+            (x1, y1, x2, y2)，未输入或格式无效时返回None
+        """
+        try:
+            x1, y1, x2, y2 = (int(v) for v in self.region_var.get().split(','))
+        except ValueError:
+            return None
+        if x2 <= x1 or y2 <= y1:
+            return None
+        return (x1, y1, x2, y2)
+    
     def get_capture_interval(self) -> int:
         """获取截图间隔"""
         return self.capture_interval_var.get()
     
+    def is_ocr_detail_enabled(self) -> bool:
+        """是否在日志中显示逐条识别文本"""
+        return self.ocr_detail_var.get()
+    
+    def on_ocr_detail_toggled(self):
+        """切换显示识别文本"""
+        if self.ocr_detail_callback:
+            self.ocr_detail_callback(self.ocr_detail_var.get())
+    
     def is_timing_enabled(self) -> bool:
         """是否启用时间记录"""
         return self.timing_enabled.get()
@@ -447,9 +517,6 @@ class ProcessCaptureUI:
         if self.is_capturing and self.stop_auto_callback:
             self.stop_auto_callback()
         
-        if self.capture_thread and self.capture_thread.is_alive():
-            self.capture_thread.join(timeout=1)
-        
         self.root.destroy()
     
     def run(self):
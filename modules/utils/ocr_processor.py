@@ -4,186 +4,381 @@ OCR处理器模块
 """
 
 import os
+import time
+import atexit
+import pickle
+import hashlib
+import functools
+import threading
 import numpy as np
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from PIL import Image, ImageDraw, ImageFont
-from datetime import datetime
 from typing import List, Dict, Optional, Union
-from ..core import OCREngine
+from ..core import OCREngine, OCRResults, get_default_ocr_engine
+from ..core.pixel_ops import polys_to_aabb
+from .ui_logger import LOG_LEVELS
+
+# 可选的快速哈希库（计算截图内容指纹），未安装时使用hashlib.blake2b
+try:
+    import xxhash  # type: ignore
+except ImportError:
+    xxhash = None
+
+
+@functools.lru_cache(maxsize=None)
+def _get_fonts() -> tuple:
+    """加载绘制标记用的字体（进程内只加载一次）：优先中文黑体，其次Arial，最后PIL默认字体
+    
+    Returns:
+        (16号字体, 12号字体) 的元组
+    """
+    for font_path in ("C:/Windows/Fonts/simhei.ttf", "arial.ttf"):
+        try:
+            return ImageFont.truetype(font_path, 16), ImageFont.truetype(font_path, 12)
+        except OSError:
+            continue
+    return ImageFont.load_default(), ImageFont.load_default()
+
+
+@functools.lru_cache(maxsize=None)
+def _label_metrics() -> tuple:
+    """预先测量标签尺寸（只测量一次）：置信度文本固定为 "0.000" 形式，宽度不变
+    
+    Returns:
+        (置信度文本包围框, 文字标签上边界偏移, 文字标签下边界偏移) 的元组，均相对绘制起点
+    """
+    _, font_small = _get_fonts()
+    _, top, _, bottom = font_small.getbbox("测Ag")
+    return font_small.getbbox("0.000"), top, bottom
+
+
+@functools.lru_cache(maxsize=4096)
+def _char_width(char: str) -> float:
+    """小号字体下单个字符的宽度（按字符缓存，识别文本反复出现相同字符）"""
+    return _get_fonts()[1].getlength(char)
+
+
+def _console_log(message: str, level: str = "INFO"):
+    """未提供日志器时输出到控制台"""
+    print(f"[{level}] {message}")
 
 
 class OCRProcessor:
     """OCR处理器类，提供统一的OCR识别、绘制和保存功能"""
     
+    # 支持的保存格式：格式名 -> (扩展名, PIL保存参数)
+    # PNG使用最低压缩级别（无损且编码最快），WebP/JPEG为有损格式，编码更快、文件更小；
+    # BMP/NPY不压缩，直接写出像素数据，适合调试时大量连续截图（占用磁盘空间大）
+    SAVE_FORMATS = {
+        "png": (".png", {"format": "PNG", "compress_level": 1}),
+        "webp": (".webp", {"format": "WEBP", "quality": 85, "method": 0}),
+        "jpeg": (".jpg", {"format": "JPEG", "quality": 85}),
+        "bmp": (".bmp", {"format": "BMP"}),
+        "npy": (".npy", {}),  # NumPy数组文件，np.load即可读回
+    }
+    
+    # 识别结果缓存（LRU）条目上限：截图内容完全相同时直接复用识别结果
+    RESULT_CACHE_SIZE = 256
+    # 持久化识别结果缓存的文件名（位于保存路径下）与格式版本
+    DISK_CACHE_FILE = ".ocr_cache.pkl"
+    DISK_CACHE_VERSION = 1
+    
     def __init__(self, 
                  ocr_engine: Optional[OCREngine] = None, 
                  logger=None,
-                 save_path: str = "./screenshots"):
+                 save_path: str = "./screenshots",
+                 save_format: str = "png",
+                 persist_cache: bool = False):
         """
         初始化OCR处理器
         
         Args:
-            ocr_engine: OCR引擎实例，如果为None则会自动创建
+            ocr_engine: OCR引擎实例，如果为None则在首次识别时自动创建
             logger: 日志记录器实例
             save_path: 截图保存路径
+            save_format: 截图保存格式 "png" / "webp" / "jpeg" / "bmp" / "npy"，默认无损PNG
+            persist_cache: 是否将识别结果缓存保存到磁盘，下次启动时相同画面无需重新识别
         """
-        self.ocr_engine = ocr_engine
+        self._ocr_engine = ocr_engine
+        self._engine_init_failed = False
         self.logger = logger
+        # 日志输出函数只绑定一次，内部调用不再每次判断是否有日志器
+        self._log = logger.log_message if logger else _console_log
         self.save_path = save_path
+        self._save_dir_created = False  # 保存目录只在首次保存（或更换路径后）检查一次
+        if save_format not in self.SAVE_FORMATS:
+            raise ValueError(f"不支持的保存格式: {save_format}")
+        self.save_format = save_format
         
-        # 如果没有提供OCR引擎，创建默认实例
-        if self.ocr_engine is None:
+        # 识别结果缓存：(尺寸, 模式, 识别区域, 内容指纹) -> 识别结果
+        self._result_cache = OrderedDict()
+        self._cache_lock = threading.Lock()  # 自动截图线程与界面线程共用处理器
+        self._cache_file = None
+        if persist_cache:
+            self._cache_file = os.path.join(save_path, self.DISK_CACHE_FILE)
+            self._load_cache()
+            atexit.register(self._flush_cache)
+        
+        # 截图编码与写文件在单线程执行器中进行，识别线程无需等待PNG压缩
+        self._save_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="OCRSave")
+    
+    @property
+    def ocr_engine(self) -> Optional[OCREngine]:
+        """OCR引擎（未提供时在首次访问时创建默认实例，只保存截图时不加载模型）"""
+        if self._ocr_engine is None and not self._engine_init_failed:
             self._init_default_ocr_engine()
+        return self._ocr_engine
+    
+    @ocr_engine.setter
+    def ocr_engine(self, engine: Optional[OCREngine]):
+        """替换OCR引擎（设为None时在下次访问时重新创建默认实例）"""
+        self._ocr_engine = engine
+        self._engine_init_failed = False
     
     def _init_default_ocr_engine(self):
         """初始化默认OCR引擎"""
         try:
-            self.log_message("正在初始化OCR引擎...")
-            self.ocr_engine = OCREngine(
+            self._log("正在初始化OCR引擎...")
+            self._ocr_engine = get_default_ocr_engine(
                 lang="ch",
                 use_gpu=False,
                 confidence_threshold=0.7  # 使用项目标准配置
             )
-            self.log_message("OCR引擎初始化完成（标准模式，平均识别时间~0.2秒）")
+            self._log("OCR引擎初始化完成（标准模式，平均识别时间~0.2秒）")
         except Exception as e:
-            self.log_message(f"OCR引擎初始化失败: {e}", "ERROR")
-            self.ocr_engine = None
+            # 初始化失败后不再重试，避免每次识别都重新加载模型
+            self._log(f"OCR引擎初始化失败: {e}", "ERROR")
+            self._ocr_engine = None
+            self._engine_init_failed = True
     
     def log_message(self, message: str, level: str = "INFO"):
         """记录日志消息"""
-        if self.logger:
-            self.logger.log_message(message, level)
+        self._log(message, level)
+    
+    def is_log_enabled(self, level: str) -> bool:
+        """检查某个级别的消息是否会被输出（无日志器时只输出INFO及以上）"""
+        if self.logger is not None and hasattr(self.logger, 'is_enabled_for'):
+            return self.logger.is_enabled_for(level)
+        return LOG_LEVELS.get(level, 20) >= LOG_LEVELS['INFO']
+    
+    @staticmethod
+    def _content_key(screenshot: Image.Image, region: Optional[tuple]) -> tuple:
+        """计算截图内容的缓存键（对全部像素求哈希，不同画面不会误命中）"""
+        data = screenshot.tobytes()
+        if xxhash is not None:
+            digest = xxhash.xxh3_128_digest(data)
         else:
-            print(f"[{level}] {message}")
+            digest = hashlib.blake2b(data, digest_size=16).digest()
+        return (screenshot.size, screenshot.mode, tuple(region) if region else None, digest)
+    
+    @staticmethod
+    def _is_blank(screenshot: Image.Image, region: Optional[tuple]) -> bool:
+        """判断截图（或识别区域）是否为纯色：各颜色通道的最小值与最大值相同"""
+        if region:
+            screenshot = screenshot.crop(tuple(region))
+        extrema = screenshot.getextrema()
+        if not isinstance(extrema[0], tuple):
+            extrema = (extrema,)  # 单通道图像
+        return all(low == high for low, high in extrema[:3])  # 忽略Alpha通道
     
     def recognize_and_save(self, 
                           screenshot: Image.Image, 
                           process_info: Optional[Dict] = None,
-                          filename_prefix: str = "capture") -> List[Dict]:
+                          filename_prefix: str = "capture",
+                          region: Optional[tuple] = None) -> OCRResults:
         """
         OCR文字识别并保存结果（统一封装的核心功能）
         
+        识别结果直接绘制在screenshot上并交给后台线程保存，调用方之后不应再使用该图像。
+        
         Args:
             screenshot: 截图 PIL 图像对象
             process_info: 进程信息字典，包含name和pid等信息（可选）
             filename_prefix: 文件名前缀，默认为"capture"
+            region: 固定识别区域 (x1, y1, x2, y2)，指定时跳过文字检测（可选）
             
         Returns:
             OCR识别结果列表
         """
-        if self.ocr_engine is None:
-            self.log_message("OCR引擎未初始化，无法进行识别", "ERROR")
+        ocr_engine = self.ocr_engine
+        if ocr_engine is None:
+            self._log("OCR引擎未初始化，无法进行识别", "ERROR")
             # 保存原始截图
             self.save_screenshot(screenshot, [], process_info, filename_prefix)
-            return []
+            return OCRResults()
         
         try:
-            # 使用OCR引擎识别PIL图像
-            high_confidence_results = self.ocr_engine.recognize_pil_image(screenshot)
+            # 画面与缓存一致时跳过识别
+            key = self._content_key(screenshot, region)
+            with self._cache_lock:
+                high_confidence_results = self._result_cache.get(key)
+                if high_confidence_results is not None:
+                    self._result_cache.move_to_end(key)
             
-            if high_confidence_results:
-                self.log_message(f"找到 {len(high_confidence_results)} 个高置信度结果")
-                
-                # 在截图上绘制OCR结果
-                enhanced_screenshot = self.draw_ocr_results(screenshot, high_confidence_results)
-                
-                # 保存结果
-                self.save_screenshot(enhanced_screenshot, high_confidence_results, process_info, filename_prefix)
-                
-                return high_confidence_results
+            if high_confidence_results is not None:
+                self._log("画面与缓存一致，复用OCR识别结果")
+            elif self._is_blank(screenshot, region):
+                # 纯色画面（窗口加载中、黑屏等）不可能包含文字，无需运行OCR
+                self._log("画面为纯色，跳过OCR识别")
+                high_confidence_results = OCRResults()
             else:
-                self.log_message("没有找到置信度大于0.7的识别结果")
-                
-                # 即使没有OCR结果，也保存原始截图
-                self.save_screenshot(screenshot, [], process_info, filename_prefix)
+                # 使用OCR引擎识别PIL图像（指定固定区域时只运行识别模型）
+                if region:
+                    high_confidence_results = ocr_engine.recognize_region(screenshot, region)
+                else:
+                    high_confidence_results = ocr_engine.recognize_pil_image(screenshot)
                 
-                return []
+                with self._cache_lock:
+                    self._result_cache[key] = high_confidence_results
+                    if len(self._result_cache) > self.RESULT_CACHE_SIZE:
+                        self._result_cache.popitem(last=False)
+            
+            # 绘制并保存结果
+            self.save_results(screenshot, high_confidence_results, process_info, filename_prefix,
+                              inplace=True)
+            
+            return high_confidence_results
                 
         except Exception as e:
-            self.log_message(f"OCR识别出错: {e}", "ERROR")
+            self._log(f"OCR识别出错: {e}", "ERROR")
             
             # 发生错误时，保存原始截图
             self.save_screenshot(screenshot, [], process_info, filename_prefix)
             
-            return []
+            return OCRResults()
     
-    def draw_ocr_results(self, image: Image.Image, ocr_results: List[Dict]) -> Image.Image:
+    def save_results(self, 
+                     screenshot: Image.Image, 
+                     ocr_results: List[Dict],
+                     process_info: Optional[Dict] = None,
+                     filename_prefix: str = "capture",
+                     inplace: bool = False) -> bool:
+        """
+        绘制已有的OCR识别结果并保存截图（可复用缓存的识别结果，无需再次识别）
+        
+        Args:
+            screenshot: 截图 PIL 图像对象
+            ocr_results: OCR识别结果列表
+            process_info: 进程信息字典（可选）
+            filename_prefix: 文件名前缀
+            inplace: 是否直接在screenshot上绘制并交给后台线程（调用方不再使用该图像时整帧不复制）
+            
+        Returns:
+            是否保存成功
+        """
+        if ocr_results:
+            self._log(f"找到 {len(ocr_results)} 个高置信度结果")
+            
+            # 绘制OCR结果（非inplace时绘制在副本上）
+            enhanced_screenshot = self.draw_ocr_results(screenshot, ocr_results, inplace=inplace)
+            
+            # 保存结果：标注副本或调用方交出的原图直接交给后台线程，不再复制
+            # （非inplace且绘制失败时返回的是调用方的原图，仍需复制）
+            return self.save_screenshot(enhanced_screenshot, ocr_results, process_info, filename_prefix,
+                                        copy_image=not inplace and enhanced_screenshot is screenshot)
+        
+        self._log("没有找到置信度大于0.7的识别结果")
+        
+        # 即使没有OCR结果，也保存原始截图
+        return self.save_screenshot(screenshot, [], process_info, filename_prefix, copy_image=not inplace)
+    
+    def draw_ocr_results(self, image: Image.Image, ocr_results: List[Dict],
+                         inplace: bool = False) -> Image.Image:
         """
         在图像上绘制OCR识别结果（统一的可视化标记功能）
         
         Args:
             image: PIL图像对象
             ocr_results: OCR识别结果列表
+            inplace: 是否直接在原图上绘制（调用方不再需要原图时可省去整幅图像的复制）
             
         Returns:
             绘制后的PIL图像对象
         """
         try:
-            # 创建可编辑的图像副本
-            draw_image = image.copy()
+            # 默认创建可编辑的图像副本
+            draw_image = image if inplace else image.copy()
             draw = ImageDraw.Draw(draw_image)
             
-            # 尝试加载中文字体
+            # 中文字体（首次绘制时加载，之后复用）
+            font, font_small = _get_fonts()
             try:
-                font = ImageFont.truetype("C:/Windows/Fonts/simhei.ttf", 16)
-                font_small = ImageFont.truetype("C:/Windows/Fonts/simhei.ttf", 12)
-            except:
-                try:
-                    font = ImageFont.truetype("arial.ttf", 16)
-                    font_small = ImageFont.truetype("arial.ttf", 12)
-                except:
-                    font = ImageFont.load_default()
-                    font_small = ImageFont.load_default()
+                conf_bbox, line_top, line_bottom = _label_metrics()
+                measured = hasattr(font_small, 'getlength')
+            except Exception:
+                # 旧版PIL的位图字体不支持getbbox，回退为逐个精确测量
+                measured = False
             
-            self.log_message(f"开始绘制 {len(ocr_results)} 个高置信度文字框")
+            self._log(f"开始绘制 {len(ocr_results)} 个高置信度文字框")
             
-            for i, result in enumerate(ocr_results, 1):
-                box = result['box']
-                text = result['text']
-                confidence = result['confidence']
-                
-                # 转换坐标点
-                points = np.array(box, dtype=np.int32)
-                
+            # 一次性计算所有文字框的包围框 [x1, y1, x2, y2]
+            if not isinstance(ocr_results, OCRResults):
+                ocr_results = OCRResults(
+                    [result['text'] for result in ocr_results],
+                    np.array([result['confidence'] for result in ocr_results], dtype=np.float64),
+                    np.array([result['box'] for result in ocr_results], dtype=np.float32).reshape(len(ocr_results), -1, 2)
+                )
+            boxes = ocr_results.boxes
+            aabbs = polys_to_aabb(boxes, draw_image.size)
+            # 顶点坐标一次转换为扁平列表 [x1, y1, x2, y2, ...]，PIL直接接受
+            polygons = boxes.astype(np.int32).reshape(len(boxes), -1).tolist()
+            # 只为20字符以内的文本绘制文字标签，掩码一次算好
+            short_mask = np.fromiter((len(text) <= 20 for text in ocr_results.texts),
+                                     dtype=bool, count=len(ocr_results.texts))
+            
+            # 直接遍历各列数据，不再为每个结果构造字典
+            for text, confidence, aabb, polygon, is_short in zip(ocr_results.texts, ocr_results.confs.tolist(),
+                                                                 aabbs.tolist(), polygons, short_mask.tolist()):
                 # 绘制红色边框
-                draw.polygon([tuple(p) for p in points], outline='red', width=2)
+                draw.polygon(polygon, outline='red', width=2)
                 
                 # 在文本框上方显示置信度
-                x_min = min([p[0] for p in points])
-                y_min = min([p[1] for p in points])
+                x_min, y_min, _, y_max = aabb
                 
                 # 置信度文本
                 conf_text = f"{confidence:.3f}"
                 
-                # 绘制置信度背景和文本
+                # 绘制置信度背景和文本（背景框使用预先测量的尺寸，不再逐个调用textbbox）
                 try:
-                    bbox = draw.textbbox((x_min, y_min - 25), conf_text, font=font_small)
+                    y = y_min - 25
+                    if measured:
+                        left, top, right, bottom = conf_bbox
+                        bbox = (x_min + left, y + top, x_min + right, y + bottom)
+                    else:
+                        bbox = draw.textbbox((x_min, y), conf_text, font=font_small)
                     draw.rectangle(bbox, fill='red', outline='red')
-                    draw.text((x_min, y_min - 25), conf_text, fill='white', font=font_small)
+                    draw.text((x_min, y), conf_text, fill='white', font=font_small)
                 except:
                     draw.text((x_min, y_min - 25), conf_text, fill='red', font=font_small)
                 
                 # 在文本框左下方显示识别文本（限制20字符内）
-                if len(text) <= 20:
-                    y_max = max([p[1] for p in points])
+                if is_short:
+                    y = y_max + 5
                     try:
-                        text_bbox = draw.textbbox((x_min, y_max + 5), text, font=font_small)
-                        draw.rectangle(text_bbox, fill='blue', outline='blue')
-                        draw.text((x_min, y_max + 5), text, fill='white', font=font_small)
+                        if measured:
+                            # 按字符宽度求和估算文本宽度（忽略字距调整）
+                            text_box = (x_min, y + line_top, x_min + sum(map(_char_width, text)), y + line_bottom)
+                        else:
+                            text_box = draw.textbbox((x_min, y), text, font=font_small)
+                        draw.rectangle(text_box, fill='blue', outline='blue')
+                        draw.text((x_min, y), text, fill='white', font=font_small)
                     except:
-                        draw.text((x_min, y_max + 5), text, fill='blue', font=font_small)
+                        draw.text((x_min, y), text, fill='blue', font=font_small)
             
-            self.log_message("文字框绘制完成")
+            self._log("文字框绘制完成")
             return draw_image
             
         except Exception as e:
-            self.log_message(f"绘制OCR结果时出错: {e}", "ERROR")
+            self._log(f"绘制OCR结果时出错: {e}", "ERROR")
             return image
     
     def save_screenshot(self, 
                        screenshot: Image.Image, 
                        ocr_results: List[Dict],
                        process_info: Optional[Dict] = None,
-                       filename_prefix: str = "capture") -> bool:
+                       filename_prefix: str = "capture",
+                       copy_image: bool = True) -> bool:
         """
         保存截图文件（统一的智能文件命名规范）
         
@@ -192,55 +387,142 @@ class OCRProcessor:
             ocr_results: OCR识别结果列表
             process_info: 进程信息字典，包含name和pid等信息（可选）
             filename_prefix: 文件名前缀
+            copy_image: 是否复制图像后再交给后台线程；调用方保证之后不再修改图像时可设为False
             
         Returns:
-            是否保存成功
+            是否已提交保存（编码与写文件在后台完成，失败时记录错误日志）
         """
         try:
             # 确保保存路径存在
-            if not os.path.exists(self.save_path):
+            if not self._save_dir_created:
                 os.makedirs(self.save_path, exist_ok=True)
+                self._save_dir_created = True
             
             # 生成文件名（遵循项目智能命名规范）
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
+            ext, save_options = self.SAVE_FORMATS[self.save_format]
             
             if process_info and 'name' in process_info and 'pid' in process_info:
-                # 包含进程信息的命名：进程名_PID_时间戳_OCR_N个文字.png
-                if self.ocr_engine and len(ocr_results) > 0:
-                    filename = f"{process_info['name']}_{process_info['pid']}_{timestamp}_OCR_{len(ocr_results)}个文字.png"
+                # 包含进程信息的命名：进程名_PID_时间戳_OCR_N个文字.扩展名
+                if len(ocr_results) > 0:
+                    filename = f"{process_info['name']}_{process_info['pid']}_{timestamp}_OCR_{len(ocr_results)}个文字{ext}"
                 else:
-                    filename = f"{process_info['name']}_{process_info['pid']}_{timestamp}_无OCR.png"
+                    filename = f"{process_info['name']}_{process_info['pid']}_{timestamp}_无OCR{ext}"
             else:
-                # 通用命名：前缀_时间戳_OCR_N个文字.png
-                if self.ocr_engine and len(ocr_results) > 0:
-                    filename = f"{filename_prefix}_{timestamp}_OCR_{len(ocr_results)}个文字.png"
+                # 通用命名：前缀_时间戳_OCR_N个文字.扩展名
+                if len(ocr_results) > 0:
+                    filename = f"{filename_prefix}_{timestamp}_OCR_{len(ocr_results)}个文字{ext}"
                 else:
-                    filename = f"{filename_prefix}_{timestamp}_无OCR.png"
+                    filename = f"{filename_prefix}_{timestamp}_无OCR{ext}"
             
             file_path = os.path.join(self.save_path, filename)
             
-            # 保存截图
-            screenshot.save(file_path)
+            # 保存截图（JPEG不支持Alpha通道）；默认复制一份交给后台线程，调用方可继续复用原图像
+            if self.save_format == "jpeg" and screenshot.mode != "RGB":
+                screenshot = screenshot.convert("RGB")
+            elif copy_image:
+                screenshot = screenshot.copy()
+            self._save_pool.submit(self._write_screenshot, screenshot, file_path, save_options)
             
-            self.log_message(f"截图完成，已保存到: {file_path}")
-            self.log_message(f"OCR结果: {len(ocr_results)} 个高置信度文字")
+            self._log(f"OCR结果: {len(ocr_results)} 个高置信度文字")
             
-            # 输出OCR识别结果详情
-            if ocr_results:
-                self.log_message("\n=== OCR识别结果 ===")
-                for i, result in enumerate(ocr_results, 1):
-                    self.log_message(f"{i}. 文本: {result['text']}, 置信度: {result['confidence']:.3f}")
-                self.log_message("=" * 30)
+            # 输出OCR识别结果详情（DEBUG级别，未启用时不格式化逐条消息）
+            if ocr_results and self.is_log_enabled("DEBUG"):
+                # 拼接为一条多行消息，日志回调只调用一次
+                lines = [f"{i}. 文本: {result['text']}, 置信度: {result['confidence']:.3f}"
+                         for i, result in enumerate(ocr_results, 1)]
+                self._log("\n=== OCR识别结果 ===\n" + "\n".join(lines) + "\n" + "=" * 30, "DEBUG")
             
             return True
             
         except Exception as e:
-            self.log_message(f"保存截图失败: {e}", "ERROR")
+            self._log(f"保存截图失败: {e}", "ERROR")
             return False
     
+    def _write_screenshot(self, screenshot: Image.Image, file_path: str, save_options: dict):
+        """编码并写入截图文件（在保存执行器线程中执行）"""
+        try:
+            if self.save_format == "npy":
+                np.save(file_path, np.asarray(screenshot))
+            else:
+                screenshot.save(file_path, **save_options)
+            self._log(f"截图完成，已保存到: {file_path}")
+        except Exception as e:
+            self._log(f"保存截图失败: {e}", "ERROR")
+    
+    @staticmethod
+    def _digest_name() -> str:
+        """内容指纹使用的哈希算法（持久化缓存只在算法一致时加载）"""
+        return "xxh3_128" if xxhash is not None else "blake2b"
+    
+    def _load_cache(self):
+        """从磁盘加载上次运行保存的识别结果缓存（文件损坏或版本不符时忽略）"""
+        if not os.path.exists(self._cache_file):
+            return
+        try:
+            with open(self._cache_file, 'rb') as f:
+                data = pickle.load(f)
+            if data.get('version') != self.DISK_CACHE_VERSION or data.get('digest') != self._digest_name():
+                return
+            # 条目按最近使用顺序保存，超出容量时保留最新的部分
+            for key, (texts, confs, boxes) in data['entries'][-self.RESULT_CACHE_SIZE:]:
+                self._result_cache[key] = OCRResults(texts, confs, boxes)
+            self._log(f"已加载 {len(self._result_cache)} 条OCR识别结果缓存")
+        except Exception as e:
+            self._log(f"加载OCR识别结果缓存失败: {e}", "WARNING")
+    
+    def _flush_cache(self):
+        """将识别结果缓存写入磁盘（程序退出时调用）"""
+        if self._cache_file is None:
+            return
+        with self._cache_lock:
+            entries = [(key, (results.texts, results.confs, results.boxes))
+                       for key, results in self._result_cache.items()]
+        try:
+            os.makedirs(os.path.dirname(self._cache_file) or ".", exist_ok=True)
+            # 先写临时文件再替换，退出过程中被中断时不会留下损坏的缓存
+            tmp_file = self._cache_file + ".tmp"
+            with open(tmp_file, 'wb') as f:
+                pickle.dump({'version': self.DISK_CACHE_VERSION, 'digest': self._digest_name(),
+                             'entries': entries}, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, self._cache_file)
+        except Exception as e:
+            print(f"保存OCR识别结果缓存失败: {e}")
+    
+    def clear_cache(self):
+        """清空识别结果缓存"""
+        with self._cache_lock:
+            self._result_cache.clear()
+    
+    def close(self):
+        """释放资源：等待未完成的截图保存、写出持久化缓存、清空缓存并释放OCR引擎
+        
+        OCR引擎提供close方法时（如OCRSubprocessClient）一并关闭；默认单例引擎无close方法，
+        只解除引用。关闭后处理器不应再使用。
+        """
+        self._save_pool.shutdown(wait=True)
+        if self._cache_file is not None:
+            self._flush_cache()
+            atexit.unregister(self._flush_cache)
+            self._cache_file = None
+        self.clear_cache()
+        
+        engine, self._ocr_engine = self._ocr_engine, None
+        self._engine_init_failed = True  # 关闭后不再自动创建默认引擎
+        close_engine = getattr(engine, 'close', None)
+        if close_engine is not None:
+            close_engine()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
     def set_save_path(self, save_path: str):
         """设置保存路径"""
         self.save_path = save_path
+        self._save_dir_created = False
     
     def get_save_path(self) -> str:
         """获取保存路径"""
@@ -250,16 +532,20 @@ class OCRProcessor:
 # 便捷函数
 def create_ocr_processor(ocr_engine: Optional[OCREngine] = None, 
                         logger=None,
-                        save_path: str = "./screenshots") -> OCRProcessor:
+                        save_path: str = "./screenshots",
+                        save_format: str = "png",
+                        persist_cache: bool = False) -> OCRProcessor:
     """
     创建OCR处理器实例的便捷函数
     
     Args:
-        ocr_engine: OCR引擎实例，如果为None则会自动创建
+        ocr_engine: OCR引擎实例，如果为None则在首次识别时自动创建
         logger: 日志记录器实例
         save_path: 截图保存路径
+        save_format: 截图保存格式 "png" / "webp" / "jpeg" / "bmp" / "npy"
+        persist_cache: 是否将识别结果缓存保存到磁盘
         
     Returns:
         OCRProcessor实例
     """
-    return OCRProcessor(ocr_engine, logger, save_path)
\ No newline at end of file
+    return OCRProcessor(ocr_engine, logger, save_path, save_format, persist_cache)
\ No newline at end of file
@@ -3,23 +3,47 @@ UI日志系统模块
 功能：日志输出、时间记录、性能监控
 """
 
-import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
-import threading
+import time
 from datetime import datetime
-from typing import Dict, Any, Optional, Callable
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Callable, Mapping
+
+# 日志级别数值，低于最低级别的消息直接丢弃
+LOG_LEVELS = {'DEBUG': 10, 'INFO': 20, 'WARNING': 30, 'ERROR': 40}
 
 class UILogger:
     """UI日志系统类"""
     
-    def __init__(self, log_callback: Optional[Callable[[str, str], None]] = None):
+    def __init__(self, log_callback: Optional[Callable[[str, str], None]] = None,
+                 min_level: str = "INFO"):
         """初始化UI日志系统
         
         Args:
             log_callback: 日志回调函数，接收(message, level)参数
+            min_level: 最低输出级别，默认INFO（DEBUG消息不输出）
         """
         self.log_callback = log_callback
         self.timing_enabled = True
+        self._min_level_val = LOG_LEVELS[min_level]
+    
+    def is_enabled_for(self, level: str) -> bool:
+        """检查某个级别的消息是否会被输出（调用方可据此跳过消息格式化）
+        
+        Args:
+            level: 日志级别
+            
+        Returns:
+            是否会输出
+        """
+        return LOG_LEVELS.get(level, 20) >= self._min_level_val
+    
+    def set_min_level(self, level: str):
+        """设置最低输出级别
+        
+        Args:
+            level: 日志级别 DEBUG / INFO / WARNING / ERROR
+        """
+        self._min_level_val = LOG_LEVELS[level]
     
     def log_message(self, message: str, level: str = "INFO"):
         """在日志区域显示消息
@@ -28,6 +52,8 @@ class UILogger:
             message: 日志消息
             level: 日志级别
         """
+        if LOG_LEVELS.get(level, 20) < self._min_level_val:
+            return
         try:
             if self.log_callback:
                 self.log_callback(message, level)
@@ -91,8 +117,8 @@ class TimingRecorder:
         Args:
             task_name: 任务名称
         """
-        import time
-        self.start_times[task_name] = time.time()
+        # 单调高精度时钟：不受系统时间调整影响，亚秒级耗时也能测准
+        self.start_times[task_name] = time.perf_counter()
         
         if self.logger:
             self.logger.log_message(f"开始计时: {task_name}")
@@ -103,9 +129,8 @@ class TimingRecorder:
         Args:
             task_name: 任务名称
         """
-        import time
         if task_name in self.start_times:
-            elapsed_time = time.time() - self.start_times[task_name]
+            elapsed_time = time.perf_counter() - self.start_times[task_name]
             self.timing_data[task_name] = elapsed_time
             
             if self.logger:
@@ -137,13 +162,13 @@ class TimingRecorder:
         """
         return self.timing_data.get(task_name)
     
-    def get_all_timings(self) -> Dict[str, float]:
+    def get_all_timings(self) -> Mapping[str, float]:
         """获取所有任务的耗时
         
         Returns:
-            所有任务的耗时字典
+            所有任务耗时的只读视图（随后续计时更新，需要修改或保留快照时请用dict()复制）
         """
-        return self.timing_data.copy()
+        return MappingProxyType(self.timing_data)
     
     def clear_timings(self):
         """清空所有计时数据"""
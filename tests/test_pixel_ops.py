@@ -0,0 +1,36 @@
+"""
+像素处理内核测试
+"""
+
+import numpy as np
+import pytest
+
+Image = pytest.importorskip("PIL.Image")
+pytest.importorskip("cv2")
+pytest.importorskip("win32gui")  # modules.core 包导入Win32截图引擎
+
+from modules.core.pixel_ops import rgb_to_bgr, bgrx_to_gray
+
+
+def test_rgb_to_bgr_accepts_readonly_pil_array():
+    """np.asarray(PIL图像) 返回只读数组，内核必须接受"""
+    pixels = np.asarray(Image.new('RGB', (32, 16), (10, 20, 30)))
+    assert not pixels.flags.writeable
+
+    bgr = rgb_to_bgr(pixels)
+    assert bgr.shape == (16, 32, 3)
+    assert tuple(bgr[0, 0]) == (30, 20, 10)
+
+
+def test_rgb_to_bgr_accepts_readonly_rgba_view():
+    """只读RGBA数组及其非连续切片视图"""
+    pixels = np.asarray(Image.new('RGBA', (8, 8), (1, 2, 3, 255)))
+    bgr = rgb_to_bgr(pixels[:, ::-1])
+    assert tuple(bgr[3, 3]) == (3, 2, 1)
+
+
+def test_bgrx_to_gray_accepts_readonly_array():
+    pixels = np.asarray(Image.new('RGB', (8, 4), (0, 0, 0)))
+    gray, mean = bgrx_to_gray(pixels)
+    assert gray.shape == (4, 8)
+    assert mean == 0.0
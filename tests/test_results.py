@@ -0,0 +1,60 @@
+"""
+结果集合（OCRResults / ProcessResults）测试
+"""
+
+import pytest
+
+pytest.importorskip("paddleocr")
+pytest.importorskip("win32gui")  # modules.core 包导入Win32截图引擎
+
+from modules.core import OCRResults, ProcessResults
+
+
+def _lines():
+    return [
+        [[[0, 0], [10, 0], [10, 5], [0, 5]], ("甲", 0.9)],
+        [[[0, 10], [10, 10], [10, 15], [0, 15]], ("乙", 0.5)],
+        [[[0, 20], [10, 20], [10, 25], [0, 25]], ("丙", 0.8)],
+    ]
+
+
+def test_ocr_results_from_empty_lines():
+    results = OCRResults.from_lines([])
+    assert len(results) == 0
+    assert results.boxes.shape == (0, 4, 2)
+    assert list(results) == []
+
+
+def test_ocr_results_slice_returns_subset():
+    results = OCRResults.from_lines(_lines())
+    subset = results[1:]
+    assert isinstance(subset, OCRResults)
+    assert subset.texts == ["乙", "丙"]
+    assert subset.confs.tolist() == [0.5, 0.8]
+    assert subset.boxes.shape == (2, 4, 2)
+    assert len(results[:0]) == 0
+
+
+def test_ocr_results_index_and_iter_match():
+    results = OCRResults.from_lines(_lines())
+    assert results[-1]['text'] == "丙"
+    assert list(results)[0] == results[0]
+    assert results[0]['box'] == [[0.0, 0.0], [10.0, 0.0], [10.0, 5.0], [0.0, 5.0]]
+
+
+def test_process_results_empty():
+    results = ProcessResults()
+    assert len(results) == 0
+    assert list(results) == []
+    assert len(results[:]) == 0
+
+
+def test_process_results_slice_returns_subset():
+    results = ProcessResults()
+    results.append(1, "a.exe", "A", 100)
+    results.append(2, "b.exe", "B", 200)
+    subset = results[1:]
+    assert isinstance(subset, ProcessResults)
+    assert len(subset) == 1
+    assert subset[0] == {'pid': 2, 'name': 'b.exe', 'window_title': 'B', 'hwnd': 200}
+    assert list(results)[1] == results[1]